@@ -666,8 +666,13 @@ def _non_default_skills(
     read signature that OCR duplicated or shifted off slot 0 is never trained as
     a draftable feature the client can't activate).
     """
-    skills = hero.get("skills") or []
-    signature = default_skill.get(hero.get("name", ""))
+    return _draftable_skills(
+        hero.get("skills") or [], default_skill.get(hero.get("name", ""))
+    )
+
+
+def _draftable_skills(skills: list[str], signature: str | None) -> list[str]:
+    """:func:`_non_default_skills` for a hero whose fields were already read."""
     out: list[str] = []
     seen: set[str] = set()
     for skill in skills[DEFAULT_SKILL_INDEX + 1:]:
@@ -697,37 +702,52 @@ def team_features(
     """
     feats: dict[str, int] = {}
 
-    heroes = [h.get("name", "") for h in team if h.get("name")]
-    for hero in heroes:
-        feats[f"{F_HERO}|{hero}"] = 1
-
-    # Unordered hero pairs.
-    uniq_heroes = sorted(set(heroes))
-    for i in range(len(uniq_heroes)):
-        for j in range(i + 1, len(uniq_heroes)):
-            feats[f"{F_HERO_PAIR}|{uniq_heroes[i]}|{uniq_heroes[j]}"] = 1
-
+    # One pass over the roster: hero, skill, hero-skill and within-hero skill
+    # pair features, collecting hero names for the pair features below.
+    heroes: list[str] = []
     for hero_data in team:
         hero = hero_data.get("name", "")
         if not hero:
             continue
-        skills = _non_default_skills(hero_data, default_skill)
+        heroes.append(hero)
+        feats[f"{F_HERO}|{hero}"] = 1
+        skills = _draftable_skills(
+            hero_data.get("skills") or [], default_skill.get(hero)
+        )
         for skill in skills:
             feats[f"{F_SKILL}|{skill}"] = 1
             feats[f"{F_HERO_SKILL}|{hero}|{skill}"] = 1
         # Within-hero skill pairs (sorted for order independence).
-        s_sorted = sorted(set(skills))
+        s_sorted = sorted(skills)
         for i in range(len(s_sorted)):
             for j in range(i + 1, len(s_sorted)):
                 feats[f"{F_SKILL_PAIR}|{hero}|{s_sorted[i]}|{s_sorted[j]}"] = 1
 
+    # Unordered hero pairs.
+    uniq_heroes = sorted(set(heroes))
+    for i in range(len(uniq_heroes)):
+        for j in range(i + 1, len(uniq_heroes)):
+            feats[f"{F_HERO_PAIR}|{uniq_heroes[i]}|{uniq_heroes[j]}"] = 1
+
     return feats
 
 
-def paired_difference(b: Battle, default_skill: Mapping[str, str]) -> dict[str, int]:
-    """team1 features minus team2 features for a battle (values in {-1,0,1})."""
-    f1 = team_features(b.team1, default_skill)
-    f2 = team_features(b.team2, default_skill)
+def battle_team_features(
+    battles: list[Battle], default_skill: Mapping[str, str]
+) -> list[tuple[dict[str, int], dict[str, int]]]:
+    """``(team1, team2)`` feature maps per battle, computed once.
+
+    Support counting and design-matrix construction both need every battle's
+    team features; callers that do both on the same battles pass this list to
+    each so the string-keyed feature maps are built a single time.
+    """
+    return [
+        (team_features(b.team1, default_skill), team_features(b.team2, default_skill))
+        for b in battles
+    ]
+
+
+def _feature_difference(f1: dict[str, int], f2: dict[str, int]) -> dict[str, int]:
     diff: dict[str, int] = {}
     for key in set(f1) | set(f2):
         val = f1.get(key, 0) - f2.get(key, 0)
@@ -736,19 +756,31 @@ def paired_difference(b: Battle, default_skill: Mapping[str, str]) -> dict[str,
     return diff
 
 
+def paired_difference(b: Battle, default_skill: Mapping[str, str]) -> dict[str, int]:
+    """team1 features minus team2 features for a battle (values in {-1,0,1})."""
+    return _feature_difference(
+        team_features(b.team1, default_skill),
+        team_features(b.team2, default_skill),
+    )
+
+
 def compute_support(
-    battles: list[Battle], default_skill: Mapping[str, str]
+    battles: list[Battle],
+    default_skill: Mapping[str, str],
+    *,
+    team_feats: list[tuple[dict[str, int], dict[str, int]]] | None = None,
 ) -> dict[str, int]:
     """How many battles each feature appears in (on either team).
 
     Support = evidence count for shrinking/dropping sparse interactions and for
-    reporting per-recommendation evidence in the UI.
+    reporting per-recommendation evidence in the UI. ``team_feats`` is an
+    optional precomputed :func:`battle_team_features` result for ``battles``.
     """
+    if team_feats is None:
+        team_feats = battle_team_features(battles, default_skill)
     support: dict[str, int] = defaultdict(int)
-    for b in battles:
-        seen = set(team_features(b.team1, default_skill)) | set(
-            team_features(b.team2, default_skill)
-        )
+    for _battle, (f1, f2) in zip(battles, team_feats, strict=True):
+        seen = f1.keys() | f2.keys()
         for key in seen:
             support[key] += 1
     return dict(support)
@@ -806,19 +838,24 @@ def build_design_matrix(
     battles: list[Battle],
     feature_index: dict[str, int],
     default_skill: Mapping[str, str],
+    *,
+    team_feats: list[tuple[dict[str, int], dict[str, int]]] | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Return ``(X, y)`` for the paired logistic regression.
 
     ``X[i]`` is the ``team1 - team2`` feature difference restricted to the
     selected ``feature_index``; ``y[i] = 1`` iff team 1 won. Features outside the
-    index are ignored (they were dropped for sparsity).
+    index are ignored (they were dropped for sparsity). ``team_feats`` is an
+    optional precomputed :func:`battle_team_features` result for ``battles``.
     """
+    if team_feats is None:
+        team_feats = battle_team_features(battles, default_skill)
     n = len(battles)
     d = len(feature_index)
     X = np.zeros((n, d), dtype=np.float64)
     y = np.zeros(n, dtype=np.int64)
-    for i, b in enumerate(battles):
-        for key, val in paired_difference(b, default_skill).items():
+    for i, (b, (f1, f2)) in enumerate(zip(battles, team_feats, strict=True)):
+        for key, val in _feature_difference(f1, f2).items():
             col = feature_index.get(key)
             if col is not None:
                 X[i, col] = val
@@ -1230,11 +1267,15 @@ def backtest(
             },
         }
 
-    support = compute_support(train, default_skill)
+    train_feats = battle_team_features(train, default_skill)
+    test_feats = battle_team_features(test, default_skill)
+    support = compute_support(train, default_skill, team_feats=train_feats)
     features = select_features(support)
     feature_index = {fid: i for i, fid in enumerate(features)}
 
-    X_train, y_train = build_design_matrix(train, feature_index, default_skill)
+    X_train, y_train = build_design_matrix(
+        train, feature_index, default_skill, team_feats=train_feats
+    )
     coef, intercept = fit_model(X_train, y_train, c=c)
     penalty_only_weights: dict[str, float] = {}
     if catalog_seasons is not None:
@@ -1257,7 +1298,9 @@ def backtest(
             and abs(weight) >= WEIGHT_EPSILON
         }
 
-    X_test, y_test = build_design_matrix(test, feature_index, default_skill)
+    X_test, y_test = build_design_matrix(
+        test, feature_index, default_skill, team_feats=test_feats
+    )
     logits = X_test @ coef + intercept
     if penalty_only_weights:
         penalty_features = sorted(penalty_only_weights)
@@ -1269,6 +1312,7 @@ def backtest(
             test,
             penalty_index,
             default_skill,
+            team_feats=test_feats,
         )
         penalty_coef = np.asarray(
             [penalty_only_weights[feature_id] for feature_id in penalty_features],
@@ -1329,6 +1373,14 @@ def _smoothed_rate(wins: int, total: int, prior: float, strength: float = 5.0) -
     return (wins + prior * strength) / (total + strength)
 
 
+def _smoothed_rates(
+    wins: np.ndarray, totals: np.ndarray, prior: float, strength: float = 5.0
+) -> np.ndarray:
+    """Vectorized :func:`_smoothed_rate` over parallel win/total arrays."""
+    rates = (wins + prior * strength) / (totals + strength)
+    return np.where(totals > 0, rates, prior)
+
+
 def compute_analytics(
     battles: list[Battle], default_skill: Mapping[str, str]
 ) -> dict[str, Any]:
@@ -1338,10 +1390,14 @@ def compute_analytics(
     from the paired model (which is what recommendations use) and are smoothed
     toward the global base rate so tiny-sample items do not top the charts.
     """
-    hero_wins: dict[str, int] = defaultdict(int)
-    hero_total: dict[str, int] = defaultdict(int)
-    skill_wins: dict[str, int] = defaultdict(int)
-    skill_total: dict[str, int] = defaultdict(int)
+    # Struct-of-arrays counters: a name -> row id table plus parallel wins /
+    # totals columns, rather than a per-name dict of counters.
+    hero_id: dict[str, int] = {}
+    hero_wins: list[int] = []
+    hero_total: list[int] = []
+    skill_id: dict[str, int] = {}
+    skill_wins: list[int] = []
+    skill_total: list[int] = []
 
     global_wins = 0
     global_total = 0
@@ -1353,27 +1409,45 @@ def compute_analytics(
                 hero = hero_data.get("name", "")
                 if not hero:
                     continue
-                hero_total[hero] += 1
-                hero_wins[hero] += won
+                row = hero_id.setdefault(hero, len(hero_id))
+                if row == len(hero_total):
+                    hero_total.append(0)
+                    hero_wins.append(0)
+                hero_total[row] += 1
+                hero_wins[row] += won
                 global_total += 1
                 global_wins += won
-                for skill in _non_default_skills(hero_data, default_skill):
-                    skill_total[skill] += 1
-                    skill_wins[skill] += won
+                draftable = _draftable_skills(
+                    hero_data.get("skills") or [], default_skill.get(hero)
+                )
+                for skill in draftable:
+                    row = skill_id.setdefault(skill, len(skill_id))
+                    if row == len(skill_total):
+                        skill_total.append(0)
+                        skill_wins.append(0)
+                    skill_total[row] += 1
+                    skill_wins[row] += won
 
     prior = (global_wins / global_total) if global_total else 0.5
 
-    def rows(wins: dict[str, int], total: dict[str, int]) -> list[dict[str, Any]]:
+    def rows(
+        ids: dict[str, int], wins: list[int], total: list[int]
+    ) -> list[dict[str, Any]]:
+        w = np.asarray(wins, dtype=np.int64)
+        tot = np.asarray(total, dtype=np.int64)
+        # Same arithmetic as ``_smoothed_rate``, evaluated for every row at once
+        # (``tot`` is always positive here: a name is only counted when seen).
+        raw = w / np.maximum(tot, 1)
+        smoothed = _smoothed_rates(w, tot, prior)
         out = []
-        for name, tot in total.items():
-            w = wins[name]
+        for name, i in ids.items():
             out.append({
                 "name": name,
-                "wins": w,
-                "losses": tot - w,
-                "total": tot,
-                "win_rate": round(w / tot, 4) if tot else 0.0,
-                "smoothed_win_rate": round(_smoothed_rate(w, tot, prior), 4),
+                "wins": int(w[i]),
+                "losses": int(tot[i] - w[i]),
+                "total": int(tot[i]),
+                "win_rate": round(float(raw[i]), 4) if tot[i] else 0.0,
+                "smoothed_win_rate": round(float(smoothed[i]), 4),
             })
         # Deterministic: smoothed rate desc, then total desc, then name.
         out.sort(key=lambda r: (-r["smoothed_win_rate"], -r["total"], r["name"]))
@@ -1381,8 +1455,8 @@ def compute_analytics(
 
     return {
         "prior_win_rate": round(prior, 4),
-        "heroes": rows(hero_wins, hero_total),
-        "skills": rows(skill_wins, skill_total),
+        "heroes": rows(hero_id, hero_wins, hero_total),
+        "skills": rows(skill_id, skill_wins, skill_total),
     }
 
 
@@ -1603,11 +1677,14 @@ def build_artifact(
     — so re-running on the same inputs is byte-identical.
     """
     default_skill: Mapping[str, str] = catalog.get("default_skill", {})
-    support_all = compute_support(battles, default_skill)
+    team_feats = battle_team_features(battles, default_skill)
+    support_all = compute_support(battles, default_skill, team_feats=team_feats)
     features = select_features(support_all)
     feature_index = {fid: i for i, fid in enumerate(features)}
 
-    X, y = build_design_matrix(battles, feature_index, default_skill)
+    X, y = build_design_matrix(
+        battles, feature_index, default_skill, team_feats=team_feats
+    )
     raw_coef, intercept = fit_model(X, y)
     atomic_weights: dict[str, float] = {}
     if catalog_seasons is not None:
@@ -35,6 +35,7 @@ try:
         _CatalogSeasons,
         _load_catalog_context,
         _sigmoid,
+        battle_team_features,
         build_design_matrix,
         compute_corpus_version,
         compute_evaluation_version,
@@ -76,6 +77,7 @@ except ModuleNotFoundError:  # Support ``python -m data.evaluate_recommendation_
         _CatalogSeasons,
         _load_catalog_context,
         _sigmoid,
+        battle_team_features,
         build_design_matrix,
         compute_corpus_version,
         compute_evaluation_version,
@@ -509,10 +511,20 @@ def _evaluate_fold(
     group_ids: Sequence[str],
     default_skill: Mapping[str, str],
     catalog_seasons: _CatalogSeasons,
+    *,
+    team_feats: Sequence[tuple[dict[str, int], dict[str, int]]] | None = None,
 ) -> PredictionRows:
     train = [battles[index] for index in fold.train_indices]
     test = [battles[index] for index in fold.test_indices]
-    support = compute_support(train, default_skill)
+    if team_feats is None:
+        train_feats = battle_team_features(train, default_skill)
+        test_feats = battle_team_features(test, default_skill)
+    else:
+        if len(team_feats) != len(battles):
+            raise ValueError("battles and team_feats must have the same length")
+        train_feats = [team_feats[index] for index in fold.train_indices]
+        test_feats = [team_feats[index] for index in fold.test_indices]
+    support = compute_support(train, default_skill, team_feats=train_feats)
     excluded = () if config.include_sp else (F_SKILL_PAIR,)
     features = select_features(
         support,
@@ -524,8 +536,12 @@ def _evaluate_fold(
         feature_id: index
         for index, feature_id in enumerate(features)
     }
-    X_train, y_train = build_design_matrix(train, feature_index, default_skill)
-    X_test, y_test = build_design_matrix(test, feature_index, default_skill)
+    X_train, y_train = build_design_matrix(
+        train, feature_index, default_skill, team_feats=train_feats
+    )
+    X_test, y_test = build_design_matrix(
+        test, feature_index, default_skill, team_feats=test_feats
+    )
     if config.variant == VARIANT_SEASON_TREND:
         X_train, X_test = _add_season_trend_columns(
             X_train,
@@ -573,6 +589,7 @@ def _evaluate_fold(
             test,
             penalty_index,
             default_skill,
+            team_feats=test_feats,
         )
         penalty_coef = np.asarray(
             [penalty_only_weights[feature_id] for feature_id in penalty_features],
@@ -605,7 +622,15 @@ def evaluate_config(
     group_ids: Sequence[str],
     default_skill: Mapping[str, str],
     catalog_seasons: _CatalogSeasons,
+    *,
+    team_feats: Sequence[tuple[dict[str, int], dict[str, int]]] | None = None,
 ) -> PredictionRows:
+    """Pool held-out predictions for ``config`` across ``folds``.
+
+    ``team_feats`` optionally holds :func:`battle_team_features` for all of
+    ``battles``; folds then index into it instead of re-extracting features for
+    the same battles under every configuration.
+    """
     rows = PredictionRows.empty()
     for fold in folds:
         rows.extend(
@@ -616,6 +641,7 @@ def evaluate_config(
                 group_ids,
                 default_skill,
                 catalog_seasons,
+                team_feats=team_feats,
             )
         )
     return rows
@@ -770,6 +796,9 @@ def evaluate_protocol(
         final_season=final_season,
     )
 
+    # Team features depend only on the battle, never on the fold or config, so
+    # extract them once for the whole tuning search.
+    team_feats = battle_team_features(battles, default_skill)
     cache: dict[EvaluationConfig, PredictionRows] = {}
 
     def rows_for(config: EvaluationConfig) -> PredictionRows:
@@ -782,6 +811,7 @@ def evaluate_protocol(
                 group_ids,
                 default_skill,
                 catalog_seasons,
+                team_feats=team_feats,
             )
             cache[config] = rows
         return rows
@@ -892,6 +922,7 @@ def evaluate_protocol(
         group_ids,
         default_skill,
         catalog_seasons,
+        team_feats=team_feats,
     )
     final_production = evaluate_config(
         production_config,
@@ -900,6 +931,7 @@ def evaluate_protocol(
         group_ids,
         default_skill,
         catalog_seasons,
+        team_feats=team_feats,
     )
 
     future_reports = []
@@ -911,6 +943,7 @@ def evaluate_protocol(
             group_ids,
             default_skill,
             catalog_seasons,
+            team_feats=team_feats,
         )
         future_reports.append(
             {
@@ -945,6 +978,7 @@ def evaluate_protocol(
             group_ids,
             default_skill,
             catalog_seasons,
+            team_feats=team_feats,
         )
         underpowered_development_reports.append(
             {
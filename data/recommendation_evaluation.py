@@ -101,6 +101,10 @@ def matchup_fingerprint(battle: Any) -> str:
     """
 
     _rosters, equipped_skills = _canonical_matchup(battle)
+    return _fingerprint_states(equipped_skills)
+
+
+def _fingerprint_states(equipped_skills: Any) -> str:
     return hashlib.sha256(
         _compact_json(equipped_skills).encode("utf-8")
     ).hexdigest()
@@ -108,8 +112,15 @@ def matchup_fingerprint(battle: Any) -> str:
 
 def matchup_skill_replacements(left: Any, right: Any) -> int | None:
     """Count equipped-skill replacements for the same 3v3 hero partition."""
-    left_rosters, left_states = _canonical_matchup(left)
-    right_rosters, right_states = _canonical_matchup(right)
+    return _canonical_replacements(
+        _canonical_matchup(left),
+        _canonical_matchup(right),
+    )
+
+
+def _canonical_replacements(left: Any, right: Any) -> int | None:
+    left_rosters, left_states = left
+    right_rosters, right_states = right
     if left_rosters != right_rosters:
         return None
 
@@ -142,6 +153,30 @@ def matchup_skill_replacements(left: Any, right: Any) -> int | None:
     return min(direct, swapped)
 
 
+def _union_near_duplicates(dsu: _DisjointSet, canonical: Sequence[Any]) -> None:
+    """Join near-duplicate matchups, comparing only within one roster bucket.
+
+    ``canonical`` holds each battle's :func:`_canonical_matchup`, computed once
+    up front; the roster index limits pairwise comparison to battles that can
+    possibly match instead of re-canonicalizing both sides for every pair.
+    """
+    by_roster_partition: dict[tuple[Any, ...], list[int]] = defaultdict(list)
+    for index, (rosters, _states) in enumerate(canonical):
+        by_roster_partition[rosters].append(index)
+    for indices in by_roster_partition.values():
+        for offset, left in enumerate(indices):
+            for right in indices[offset + 1:]:
+                replacements = _canonical_replacements(
+                    canonical[left],
+                    canonical[right],
+                )
+                if (
+                    replacements is not None
+                    and replacements <= NEAR_DUPLICATE_MAX_SKILL_REPLACEMENTS
+                ):
+                    dsu.union(left, right)
+
+
 def assign_evaluation_groups(
     battles: Sequence[Any],
     *,
@@ -225,23 +260,10 @@ def assign_evaluation_groups(
                 dsu.union(previous, current)
 
     if cluster_matchups:
-        by_roster_partition: dict[tuple[Any, ...], list[int]] = defaultdict(list)
-        for index, battle in enumerate(battles):
-            rosters, _states = _canonical_matchup(battle)
-            by_roster_partition[rosters].append(index)
-        for indices in by_roster_partition.values():
-            for offset, left in enumerate(indices):
-                for right in indices[offset + 1:]:
-                    replacements = matchup_skill_replacements(
-                        battles[left],
-                        battles[right],
-                    )
-                    if (
-                        replacements is not None
-                        and replacements
-                        <= NEAR_DUPLICATE_MAX_SKILL_REPLACEMENTS
-                    ):
-                        dsu.union(left, right)
+        _union_near_duplicates(
+            dsu,
+            [_canonical_matchup(battle) for battle in battles],
+        )
 
     members: dict[int, list[int]] = defaultdict(list)
     for index in range(len(battles)):
@@ -272,29 +294,17 @@ def assign_matchup_clusters(battles: Sequence[Any]) -> list[str]:
     large capture sessions into a single giant bootstrap cluster.
     """
     dsu = _DisjointSet(len(battles))
-    by_roster_partition: dict[tuple[Any, ...], list[int]] = defaultdict(list)
-    for index, battle in enumerate(battles):
-        rosters, _states = _canonical_matchup(battle)
-        by_roster_partition[rosters].append(index)
-    for indices in by_roster_partition.values():
-        for offset, left in enumerate(indices):
-            for right in indices[offset + 1:]:
-                replacements = matchup_skill_replacements(
-                    battles[left],
-                    battles[right],
-                )
-                if (
-                    replacements is not None
-                    and replacements <= NEAR_DUPLICATE_MAX_SKILL_REPLACEMENTS
-                ):
-                    dsu.union(left, right)
+    canonical = [_canonical_matchup(battle) for battle in battles]
+    _union_near_duplicates(dsu, canonical)
 
     members: dict[int, list[int]] = defaultdict(list)
     for index in range(len(battles)):
         members[dsu.find(index)].append(index)
     cluster_for_root: dict[int, str] = {}
     for root, indices in members.items():
-        fingerprints = sorted(matchup_fingerprint(battles[index]) for index in indices)
+        fingerprints = sorted(
+            _fingerprint_states(canonical[index][1]) for index in indices
+        )
         digest = hashlib.sha256("\n".join(fingerprints).encode("utf-8")).hexdigest()[:16]
         cluster_for_root[root] = f"matchup-{digest}"
     return [cluster_for_root[dsu.find(index)] for index in range(len(battles))]
@@ -437,6 +447,76 @@ def _confidence_interval_status(
     return "available"
 
 
+def _bootstrap_metric_samples(
+    outcomes: np.ndarray,
+    probabilities: np.ndarray,
+    indices_by_group: Mapping[str, np.ndarray],
+    groups_by_stratum: Mapping[str, Sequence[str]],
+    *,
+    bootstrap_samples: int,
+    seed: int,
+) -> dict[str, np.ndarray]:
+    """Return every bootstrap replicate of :func:`point_metrics` at once.
+
+    Each metric is a per-row mean, so a replicate equals the multiplicity-
+    weighted sum of per-group row totals divided by its row count. Draws use
+    the same generator sequence as resampling rows directly; only the metric
+    arithmetic is batched into one matrix product instead of re-scoring a
+    concatenated copy of the rows for every replicate.
+    """
+    ordered_groups = sorted(indices_by_group)
+    column_for_group = {
+        group_id: column
+        for column, group_id in enumerate(ordered_groups)
+    }
+    y = np.asarray(outcomes, dtype=np.int64)
+    probs = np.asarray(probabilities, dtype=np.float64)
+    eps = 1e-12
+    row_correct = ((probs >= 0.5).astype(np.int64) == y).astype(np.float64)
+    row_log_loss = -(
+        y * np.log(probs + eps)
+        + (1 - y) * np.log(1 - probs + eps)
+    )
+    row_brier = (probs - y) ** 2
+    group_totals = np.asarray(
+        [
+            [
+                len(indices_by_group[group_id]),
+                row_correct[indices_by_group[group_id]].sum(),
+                row_log_loss[indices_by_group[group_id]].sum(),
+                row_brier[indices_by_group[group_id]].sum(),
+            ]
+            for group_id in ordered_groups
+        ],
+        dtype=np.float64,
+    ).reshape(len(ordered_groups), 4)
+
+    rng = np.random.default_rng(seed)
+    multiplicity = np.zeros(
+        (bootstrap_samples, len(ordered_groups)),
+        dtype=np.float64,
+    )
+    for sample in range(bootstrap_samples):
+        for stratum in sorted(groups_by_stratum):
+            stratum_groups = sorted(groups_by_stratum[stratum])
+            chosen = rng.integers(
+                0,
+                len(stratum_groups),
+                size=len(stratum_groups),
+            )
+            columns = [column_for_group[stratum_groups[index]] for index in chosen]
+            np.add.at(multiplicity[sample], columns, 1.0)
+
+    totals = multiplicity @ group_totals
+    sampled = totals[:, 0] > 0
+    n = totals[sampled, 0]
+    return {
+        "accuracy": totals[sampled, 1] / n,
+        "log_loss": totals[sampled, 2] / n,
+        "brier": totals[sampled, 3] / n,
+    }
+
+
 def _cluster_confidence_intervals(
     outcomes: np.ndarray,
     probabilities: np.ndarray,
@@ -460,31 +540,19 @@ def _cluster_confidence_intervals(
     ):
         return {name: None for name in point}
 
-    rng = np.random.default_rng(seed)
-    samples: dict[str, list[float]] = defaultdict(list)
-    for _ in range(bootstrap_samples):
-        sampled_indices = []
-        for stratum in sorted(groups_by_stratum):
-            stratum_groups = sorted(groups_by_stratum[stratum])
-            chosen = rng.integers(
-                0,
-                len(stratum_groups),
-                size=len(stratum_groups),
-            )
-            sampled_indices.extend(
-                indices_by_group[stratum_groups[index]]
-                for index in chosen
-            )
-        indices = np.concatenate(sampled_indices)
-        metrics = point_metrics(outcomes[indices], probabilities[indices])
-        for name, value in metrics.items():
-            if value is not None:
-                samples[name].append(value)
+    samples = _bootstrap_metric_samples(
+        outcomes,
+        probabilities,
+        indices_by_group,
+        groups_by_stratum,
+        bootstrap_samples=bootstrap_samples,
+        seed=seed,
+    )
 
     intervals: dict[str, dict[str, float] | None] = {}
     for name in point:
         values = samples.get(name, [])
-        if not values:
+        if len(values) == 0:
             intervals[name] = None
             continue
         low, high = np.percentile(values, [2.5, 97.5])
@@ -31,7 +31,10 @@ from build_recommendation_data import (  # noqa: E402
     InvalidBattleError,
     _CatalogSeasons,
     _load_catalog_context,
+    _smoothed_rate,
+    _smoothed_rates,
     apply_popularity_penalty,
+    battle_team_features,
     build,
     build_artifact,
     build_design_matrix,
@@ -323,6 +326,29 @@ def test_fit_model_deterministic():
     assert c1[1] == c2[1]
 
 
+def test_precomputed_team_features_match_per_battle_path():
+    battles = _synthetic_battles(40)
+    battles[0] = Battle("pair.json", [_hero("A", "d", "s1", "s2"), _hero("B", "d")], [_hero("weak", "d")], 1)
+    team_feats = battle_team_features(battles, {})
+    support = compute_support(battles, {})
+    assert compute_support(battles, {}, team_feats=team_feats) == support
+    index = {f: i for i, f in enumerate(sorted(support))}
+    X, y = build_design_matrix(battles, index, {})
+    X_cached, y_cached = build_design_matrix(battles, index, {}, team_feats=team_feats)
+    assert (X == X_cached).all()
+    assert (y == y_cached).all()
+
+
+def test_precomputed_team_features_must_cover_every_battle():
+    battles = _synthetic_battles(10)
+    short_feats = battle_team_features(battles[:-1], {})
+    index = {f: i for i, f in enumerate(sorted(compute_support(battles, {})))}
+    with pytest.raises(ValueError):
+        compute_support(battles, {}, team_feats=short_feats)
+    with pytest.raises(ValueError):
+        build_design_matrix(battles, index, {}, team_feats=short_feats)
+
+
 def test_fit_model_handles_single_class():
     # All team1 wins → degenerate; should return a safe zero model.
     battles = [Battle(f"{i}.json", [_hero("A", "d")], [_hero("B", "d")], 1) for i in range(30)]
@@ -534,6 +560,14 @@ def test_compute_analytics_smoothing_and_sorting():
     assert a["heroes"][0]["smoothed_win_rate"] >= a["heroes"][-1]["smoothed_win_rate"]
 
 
+def test_smoothed_rates_match_scalar_smoothing():
+    wins = np.array([0, 3, 7, 0], dtype=np.int64)
+    totals = np.array([0, 4, 9, 1], dtype=np.int64)
+    rates = _smoothed_rates(wins, totals, 0.48)
+    expected = [_smoothed_rate(int(w), int(t), 0.48) for w, t in zip(wins, totals)]
+    assert rates.tolist() == expected
+
+
 def test_build_artifact_shape_and_backtest():
     battles = _synthetic_battles(300)
     # Give each observation a distinct roster so the leakage-safe fallback has
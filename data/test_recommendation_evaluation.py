@@ -891,6 +891,27 @@ def test_fold_popularity_penalty_uses_only_training_data_and_keeps_trends(
     assert rows.feature_counts == [X_train.shape[1] + 1]
 
 
+def test_precomputed_team_features_must_cover_every_battle():
+    battles = [
+        _signal_battle(0, 12, captured_at=0.0),
+        _signal_battle(1, 13, captured_at=4_000.0),
+        _signal_battle(2, 14, captured_at=8_000.0),
+    ]
+    fold = evaluator.RollingFold(14, (0, 1), (2,))
+    short_feats = builder.battle_team_features(battles[:2], {})
+
+    with pytest.raises(ValueError, match="team_feats"):
+        evaluator.evaluate_config(
+            evaluator.EvaluationConfig(min_support_single=1, min_support_pair=1),
+            [fold],
+            battles,
+            ["train-0", "train-1", "test"],
+            {},
+            _catalog_seasons_for(battles),
+            team_feats=short_feats,
+        )
+
+
 def test_penalty_only_feature_updates_fold_coverage_diagnostics(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -997,6 +1018,46 @@ def test_cluster_confidence_intervals_and_source_breakdown_are_deterministic():
     )
 
 
+def test_batched_bootstrap_matches_row_resampling():
+    import recommendation_evaluation as evaluation
+
+    rng = np.random.default_rng(3)
+    outcomes = rng.integers(0, 2, size=40)
+    probabilities = rng.uniform(0.01, 0.99, size=40)
+    group_ids = np.asarray([f"group-{index % 12}" for index in range(40)])
+    strata = np.asarray(["a" if index % 12 < 7 else "b" for index in range(40)])
+    indices_by_group, groups_by_stratum = evaluation._bootstrap_group_layout(
+        group_ids,
+        strata,
+    )
+
+    batched = evaluation._bootstrap_metric_samples(
+        outcomes,
+        probabilities,
+        indices_by_group,
+        groups_by_stratum,
+        bootstrap_samples=50,
+        seed=7,
+    )
+
+    draws = np.random.default_rng(7)
+    for sample in range(50):
+        sampled_indices = []
+        for stratum in sorted(groups_by_stratum):
+            stratum_groups = sorted(groups_by_stratum[stratum])
+            chosen = draws.integers(0, len(stratum_groups), size=len(stratum_groups))
+            sampled_indices.extend(
+                indices_by_group[stratum_groups[index]] for index in chosen
+            )
+        indices = np.concatenate(sampled_indices)
+        expected = evaluation.point_metrics(
+            outcomes[indices],
+            probabilities[indices],
+        )
+        for name, value in expected.items():
+            assert batched[name][sample] == pytest.approx(value, rel=1e-12)
+
+
 def test_bootstrap_status_uses_the_weakest_rolling_fold():
     outcomes = [0, 1] * 9
     probabilities = [0.2, 0.8] * 9
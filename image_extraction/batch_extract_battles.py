@@ -4,206 +4,181 @@ Batch process images from ./data/images directory and save results to ./data/bat
 Only saves battles with successful fuzzy matches, reports and removes processed images
 """
 
+import argparse
+import atexit
+import io
+import multiprocessing
 import os
-import glob
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import repeat
+from typing import Dict, Iterator, List
 from skill_extraction_system import SkillExtractionSystem
 
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
 
-def batch_extract_battles(interactive: bool = True):
-    """Extract skills from all images in ./data/images and save to ./data/battles
-    If interactive=True, prompts user to resolve low-confidence skills.
-    Raises ValueError if any hero mapping is missing (data integrity issue).
+# Per-process extractor, built lazily by _get_extractor (one per worker)
+_extractor = None
+
+
+def _get_extractor() -> SkillExtractionSystem:
+    """Return this process's SkillExtractionSystem, creating it on first use"""
+    global _extractor
+    if _extractor is None:
+        _extractor = SkillExtractionSystem()
+        # Pool workers have no other shutdown hook; this flushes their crop writer
+        atexit.register(_extractor.close)
+    return _extractor
+
+
+def _process_one(image_path: str, position: int, total: int, interactive: bool = False) -> Dict:
+    """Extract, save and clean up a single image; returns its outcome record.
+
+    Top-level (picklable) so it can run in a worker process, where the
+    extractor is built once per worker and reused across images.
     """
-    
-    # Initialize the extraction system
-    print("Initializing Skill Extraction System...")
-    extractor = SkillExtractionSystem()
+    extractor = _get_extractor()
+    outcome = {'path': image_path, 'summary': None, 'saved': False, 'unsaved': None, 'remove': False}
+    try:
+        # Generate output filename
+        image_name = os.path.basename(image_path)
+        name_without_ext = os.path.splitext(image_name)[0]
+        os.makedirs(os.path.join('data', 'battles'), exist_ok=True)
+        output_path = os.path.join('data', 'battles', f'{name_without_ext}.json')
+        
+        print(f"\n[{position}/{total}] Processing: {image_path}")
+        print("-" * 50)
+        
+        # Extract skills, heroes, and winner (but don't save yet)
+        # Note: extract_skills_from_image will raise ValueError if battle is a draw (平)
+        results = extractor.extract_skills_from_image(image_path, verbose=True, interactive=interactive)
+        
+        # Check for fuzzy match failures
+        fuzzy_failures = results.get('fuzzy_match_failures', [])
+        
+        if fuzzy_failures:
+            reason_text = f"{len(fuzzy_failures)} fuzzy match failures"
+            
+            # Don't save if there are issues; mark for removal
+            print(f"✗ Skipping save due to: {reason_text}")
+            outcome['unsaved'] = {
+                'image': image_name,
+                'path': image_path,
+                'reason': reason_text,
+                'failures': fuzzy_failures
+            }
+            outcome['remove'] = True
+            
+            outcome['summary'] = {
+                'image': image_name,
+                'output': 'skipped',
+                'skills': 0,
+                'heroes': 0,
+                'winner': 'unknown',
+                'status': f'skipped: {reason_text}'
+            }
+        else:
+            # Save the results since all fuzzy matches succeeded
+            extractor.save_results(results, output_path)
 
-    # Find all images in ./data/images directory
-    image_extensions = ['*.jpg', '*.jpeg', '*.png', '*.PNG', '*.JPG', '*.JPEG']
-    image_files = []
-    
-    for ext in image_extensions:
-        image_files.extend(glob.glob(os.path.join('data', 'images', ext)))
-    
-    image_files.sort()  # Sort for consistent processing order
-    
-    print(f"Found {len(image_files)} images to process:")
-    for img in image_files:
-        print(f"  - {img}")
-    
-    print("\n" + "="*60)
-    print("BATCH EXTRACTION STARTED")
-    print("="*60)
-    
-    # Process each image
-    results_summary = []
-    successfully_saved_images = []
-    unsaved_images = []
-    images_to_remove = []  # images that should be removed due to failures or fuzzy match issues
-    
-    for i, image_path in enumerate(image_files, 1):
-        try:
-            # Generate output filename
-            image_name = os.path.basename(image_path)
-            name_without_ext = os.path.splitext(image_name)[0]
-            os.makedirs(os.path.join('data', 'battles'), exist_ok=True)
-            output_path = os.path.join('data', 'battles', f'{name_without_ext}.json')
+            # Immediately remove the image after successful save
+            try:
+                os.remove(image_path)
+                print(f"🗑️  Removed source image after save: {image_path}")
+            except Exception as re:
+                print(f"⚠️  Saved JSON but failed to remove image {image_path}: {re}")
             
-            print(f"\n[{i}/{len(image_files)}] Processing: {image_path}")
-            print("-" * 50)
+            # Summary for this image
+            teams = [team for team in results.values() if isinstance(team, list)]
+            total_skills = sum(len(hero['skills']) for team in teams for hero in team)
+            total_heroes = sum(map(len, teams))
+            winner = results.get('winner', 'unknown')
             
-            # Extract skills, heroes, and winner (but don't save yet)
-            # Note: extract_skills_from_image will raise ValueError if battle is a draw (平)
-            results = extractor.extract_skills_from_image(image_path, verbose=True, interactive=interactive)
+            outcome['saved'] = True
             
-            # Check for fuzzy match failures
-            fuzzy_failures = results.get('fuzzy_match_failures', [])
+            outcome['summary'] = {
+                'image': image_name,
+                'output': output_path,
+                'skills': total_skills,
+                'heroes': total_heroes,
+                'winner': winner,
+                'status': 'success'
+            }
             
-            if fuzzy_failures:
-                reason_text = f"{len(fuzzy_failures)} fuzzy match failures"
-                
-                # Don't save if there are issues; mark for removal
-                print(f"✗ Skipping save due to: {reason_text}")
-                unsaved_images.append({
-                    'image': image_name,
-                    'path': image_path,
-                    'reason': reason_text,
-                    'failures': fuzzy_failures
-                })
-                images_to_remove.append(image_path)
-                
-                results_summary.append({
-                    'image': image_name,
-                    'output': 'skipped',
-                    'skills': 0,
-                    'heroes': 0,
-                    'winner': 'unknown',
-                    'status': f'skipped: {reason_text}'
-                })
-            else:
-                # Save the results since all fuzzy matches succeeded
-                extractor.save_results(results, output_path)
-
-                # Immediately remove the image after successful save
-                try:
-                    os.remove(image_path)
-                    print(f"🗑️  Removed source image after save: {image_path}")
-                except Exception as re:
-                    print(f"⚠️  Saved JSON but failed to remove image {image_path}: {re}")
-                
-                # Summary for this image
-                total_skills = sum(len(hero['skills']) for team in results.values() if isinstance(team, list) for hero in team)
-                total_heroes = sum(len(team) for team in results.values() if isinstance(team, list))
-                winner = results.get('winner', 'unknown')
-                
-                successfully_saved_images.append(image_path)
-                
-                results_summary.append({
-                    'image': image_name,
-                    'output': output_path,
-                    'skills': total_skills,
-                    'heroes': total_heroes,
-                    'winner': winner,
-                    'status': 'success'
-                })
-                
-                print(f"✓ Successfully processed and saved: {total_skills} skills, {total_heroes} heroes, winner: Team {winner}")
+            print(f"✓ Successfully processed and saved: {total_skills} skills, {total_heroes} heroes, winner: Team {winner}")
+        
+    except ValueError as e:
+        error_msg = str(e)
+        # Check if this is a draw (should be discarded)
+        if "draw" in error_msg.lower() or "平" in error_msg:
+            print(f"✗ Draw detected - discarding battle: {image_path}")
+            outcome['unsaved'] = {
+                'image': os.path.basename(image_path),
+                'path': image_path,
+                'reason': 'draw (discarded)',
+                'failures': []
+            }
+            
+            outcome['summary'] = {
+                'image': os.path.basename(image_path),
+                'output': 'discarded',
+                'skills': 0,
+                'heroes': 0,
+                'winner': 'draw',
+                'status': 'draw (discarded)'
+            }
             
-        except ValueError as e:
-            error_msg = str(e)
-            # Check if this is a draw (should be discarded)
-            if "draw" in error_msg.lower() or "平" in error_msg:
-                print(f"✗ Draw detected - discarding battle: {image_path}")
-                unsaved_images.append({
-                    'image': os.path.basename(image_path),
-                    'path': image_path,
-                    'reason': 'draw (discarded)',
-                    'failures': []
-                })
-                
-                results_summary.append({
-                    'image': os.path.basename(image_path),
-                    'output': 'discarded',
-                    'skills': 0,
-                    'heroes': 0,
-                    'winner': 'draw',
-                    'status': 'draw (discarded)'
-                })
-                
-                # Remove the image immediately
-                try:
-                    os.remove(image_path)
-                    print(f"🗑️  Removed image after draw detection: {image_path}")
-                except Exception as re:
-                    print(f"⚠️  Failed to remove image {image_path}: {re}")
-            elif "普攻" in error_msg:
-                # A 普攻 (basic attack) was detected for some skill slot - discard the battle.
-                print(f"✗ 普攻 detected - discarding battle: {image_path}")
-                unsaved_images.append({
-                    'image': os.path.basename(image_path),
-                    'path': image_path,
-                    'reason': '普攻 detected (discarded)',
-                    'failures': []
-                })
+            # Remove the image immediately
+            try:
+                os.remove(image_path)
+                print(f"🗑️  Removed image after draw detection: {image_path}")
+            except Exception as re:
+                print(f"⚠️  Failed to remove image {image_path}: {re}")
+        elif "普攻" in error_msg:
+            # A 普攻 (basic attack) was detected for some skill slot - discard the battle.
+            print(f"✗ 普攻 detected - discarding battle: {image_path}")
+            outcome['unsaved'] = {
+                'image': os.path.basename(image_path),
+                'path': image_path,
+                'reason': '普攻 detected (discarded)',
+                'failures': []
+            }
 
-                results_summary.append({
-                    'image': os.path.basename(image_path),
-                    'output': 'discarded',
-                    'skills': 0,
-                    'heroes': 0,
-                    'winner': 'unknown',
-                    'status': '普攻 (discarded)'
-                })
+            outcome['summary'] = {
+                'image': os.path.basename(image_path),
+                'output': 'discarded',
+                'skills': 0,
+                'heroes': 0,
+                'winner': 'unknown',
+                'status': '普攻 (discarded)'
+            }
 
-                # Remove the image immediately
-                try:
-                    os.remove(image_path)
-                    print(f"🗑️  Removed image after 普攻 detection: {image_path}")
-                except Exception as re:
-                    print(f"⚠️  Failed to remove image {image_path}: {re}")
-            else:
-                # Other ValueError (e.g., image load failure, unknown hero, empty OCR)
-                print(f"✗ Error processing {image_path}: {e}")
-                unsaved_images.append({
-                    'image': os.path.basename(image_path),
-                    'path': image_path,
-                    'reason': f'error: {error_msg}',
-                    'failures': []
-                })
-                
-                results_summary.append({
-                    'image': os.path.basename(image_path),
-                    'output': 'failed',
-                    'skills': 0,
-                    'heroes': 0,
-                    'winner': 'unknown',
-                    'status': f'error: {error_msg}'
-                })
-                
-                # Remove the image immediately
-                try:
-                    os.remove(image_path)
-                    print(f"🗑️  Removed image after error: {image_path}")
-                except Exception as re:
-                    print(f"⚠️  Failed to remove image {image_path}: {re}")
-        except Exception as e:
+            # Remove the image immediately
+            try:
+                os.remove(image_path)
+                print(f"🗑️  Removed image after 普攻 detection: {image_path}")
+            except Exception as re:
+                print(f"⚠️  Failed to remove image {image_path}: {re}")
+        else:
+            # Other ValueError (e.g., image load failure, unknown hero, empty OCR)
             print(f"✗ Error processing {image_path}: {e}")
-            unsaved_images.append({
+            outcome['unsaved'] = {
                 'image': os.path.basename(image_path),
                 'path': image_path,
-                'reason': f'error: {str(e)}',
+                'reason': f'error: {error_msg}',
                 'failures': []
-            })
+            }
             
-            results_summary.append({
+            outcome['summary'] = {
                 'image': os.path.basename(image_path),
                 'output': 'failed',
                 'skills': 0,
                 'heroes': 0,
                 'winner': 'unknown',
-                'status': f'error: {str(e)}'
-            })
+                'status': f'error: {error_msg}'
+            }
             
             # Remove the image immediately
             try:
@@ -211,6 +186,130 @@ def batch_extract_battles(interactive: bool = True):
                 print(f"🗑️  Removed image after error: {image_path}")
             except Exception as re:
                 print(f"⚠️  Failed to remove image {image_path}: {re}")
+    except Exception as e:
+        print(f"✗ Error processing {image_path}: {e}")
+        outcome['unsaved'] = {
+            'image': os.path.basename(image_path),
+            'path': image_path,
+            'reason': f'error: {str(e)}',
+            'failures': []
+        }
+        
+        outcome['summary'] = {
+            'image': os.path.basename(image_path),
+            'output': 'failed',
+            'skills': 0,
+            'heroes': 0,
+            'winner': 'unknown',
+            'status': f'error: {str(e)}'
+        }
+        
+        # Remove the image immediately
+        try:
+            os.remove(image_path)
+            print(f"🗑️  Removed image after error: {image_path}")
+        except Exception as re:
+            print(f"⚠️  Failed to remove image {image_path}: {re}")
+
+    return outcome
+
+
+def _process_one_buffered(image_path: str, position: int, total: int) -> Dict:
+    """Worker entry point: process one image with its output captured in outcome['log']"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        outcome = _process_one(image_path, position, total)
+    outcome['log'] = buffer.getvalue()
+    return outcome
+
+
+def _parallel_outcomes(image_files: List[str], workers: int) -> Iterator[Dict]:
+    """Yield outcomes in image order, writing each image's captured log in one block"""
+    total = len(image_files)
+    # Spawned (not forked) workers so no Paddle state is inherited from the
+    # parent; each loads its own OCR models up front via the initializer
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_get_extractor,
+    ) as executor:
+        outcomes = executor.map(
+            _process_one_buffered, image_files, range(1, total + 1), repeat(total)
+        )
+        for outcome in outcomes:
+            sys.stdout.write(outcome.pop('log'))
+            yield outcome
+
+
+def batch_extract_battles(interactive: bool = True, workers: int = 1):
+    """Extract skills from all images in ./data/images and save to ./data/battles
+    If interactive=True, prompts user to resolve low-confidence skills.
+    With interactive=False and workers > 1, images are processed in parallel
+    worker processes (each loads its own OCR models).
+    Raises ValueError if any hero mapping is missing (data integrity issue).
+    """
+    
+    # Initialize the extraction system (parallel workers build their own)
+    parallel = workers > 1 and not interactive
+    if parallel:
+        print(f"Starting {workers} extraction workers...")
+    else:
+        print("Initializing Skill Extraction System...")
+        _get_extractor()
+
+    # Find all images in ./data/images directory (one directory read, any case)
+    image_dir = os.path.join('data', 'images')
+    image_files = []
+    
+    if os.path.isdir(image_dir):
+        with os.scandir(image_dir) as entries:
+            image_files = [
+                entry.path for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+            ]
+    
+    image_files.sort()  # Sort for consistent processing order
+    
+    print(f"Found {len(image_files)} images to process:")
+    for img in image_files:
+        print(f"  - {img}")
+    
+    print("\n" + "="*60)
+    print("BATCH EXTRACTION STARTED")
+    print("="*60)
+    
+    # Process each image
+    results_summary = []
+    successfully_saved_images = []
+    unsaved_images = []
+    images_to_remove = []  # images that should be removed due to failures or fuzzy match issues
+    
+    total = len(image_files)
+    if parallel:
+        # Each image is independent and OCR-bound, so fan out across processes;
+        # per-image output is buffered so workers never interleave their logs
+        outcomes = _parallel_outcomes(image_files, workers)
+    else:
+        if workers > 1:
+            print("Interactive mode prompts for input; processing images sequentially.")
+        outcomes = (
+            _process_one(image_path, i, total, interactive)
+            for i, image_path in enumerate(image_files, 1)
+        )
+
+    try:
+        for outcome in outcomes:
+            results_summary.append(outcome['summary'])
+            if outcome['saved']:
+                successfully_saved_images.append(outcome['path'])
+            if outcome['unsaved']:
+                unsaved_images.append(outcome['unsaved'])
+            if outcome['remove']:
+                images_to_remove.append(outcome['path'])
+    finally:
+        if not parallel:
+            # Done with the parent's extractor: flush and stop its crop writer
+            _get_extractor().close()
     
     # Final summary
     print("\n" + "="*60)
@@ -218,9 +317,14 @@ def batch_extract_battles(interactive: bool = True):
     print("="*60)
     
     successful = len(successfully_saved_images)
-    skipped = sum(1 for r in results_summary if r['status'].startswith('skipped:'))
-    discarded_draws = sum(1 for r in results_summary if r['status'] == 'draw (discarded)')
-    discarded_basic = sum(1 for r in results_summary if r['status'] == '普攻 (discarded)')
+    # Tally every outcome in one pass; all "skipped: <reason>" statuses share a bucket
+    status_counts = Counter(
+        'skipped:' if r['status'].startswith('skipped:') else r['status']
+        for r in results_summary
+    )
+    skipped = status_counts['skipped:']
+    discarded_draws = status_counts['draw (discarded)']
+    discarded_basic = status_counts['普攻 (discarded)']
     discarded = discarded_draws + discarded_basic
     failed = len(results_summary) - successful - skipped - discarded
     
@@ -259,4 +363,10 @@ def batch_extract_battles(interactive: bool = True):
     }
 
 if __name__ == "__main__":
-    batch_extract_battles()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Batch extract battles from ./data/images")
+    parser.add_argument("--no-interactive", action="store_true",
+                        help="Do not prompt for low-confidence skills")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parallel extraction processes (only with --no-interactive)")
+    args = parser.parse_args()
+    batch_extract_battles(interactive=not args.no_interactive, workers=args.workers)
\ No newline at end of file
@@ -12,7 +12,10 @@ from difflib import SequenceMatcher
 import os
 import glob
 import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Tuple, Optional, Callable
 
 try:
@@ -20,6 +23,19 @@ try:
 except ModuleNotFoundError:  # when run as a script from within image_extraction/
     from season import latest_season
 
+# Grayscale value -> ASCII preview character byte, one entry per uint8 level.
+# Built from the same dark-to-light ramp and scaling the preview always used.
+_ASCII_RAMP = " .:-=+*#%@"
+_ASCII_LUT = np.frombuffer(
+    bytes(ord(_ASCII_RAMP[int(px * ((len(_ASCII_RAMP) - 1) / 255.0))]) for px in range(256)),
+    dtype=np.uint8,
+)
+
+# Gamma curves for the OCR fallbacks as 256-entry tables, evaluated with the
+# exact float expression (and uint8 truncation) they replace.
+_GAMMA_LUT_05 = np.array(255 * (np.arange(256) / 255) ** 0.5, dtype='uint8')
+_GAMMA_LUT_04 = np.array(255 * (np.arange(256) / 255) ** 0.4, dtype='uint8')
+
 class SkillExtractionSystem:
     """Complete skill extraction system with OCR, fuzzy matching, and hero mapping"""
     
@@ -27,6 +43,10 @@ class SkillExtractionSystem:
     # These are commonly missed by OCR; surfaced as quick picks in interactive mode
     PREFERRED_SKILLS = ["战八方", "惩前毖后", "万人之敌", "刚烈", "闭月", "横征暴敛", "十面埋伏", "南疆烈刃", "雄护南疆"]
     
+    # Crops whose grayscale std-dev is below this are flat background with no text;
+    # real skill-name crops in the fixtures are all well above 10
+    BLANK_CROP_STD = 3.0
+    
     def __init__(self, config_path: str = os.path.join('image_extraction', 'extraction_config.json'), 
                  database_path: str = os.path.join('web', 'public', 'game-data', 'database.json')):
         """
@@ -50,6 +70,15 @@ class SkillExtractionSystem:
             for hero_name, hero_info in self.database.get('heroes', {}).items()
             if isinstance(hero_info, dict) and hero_info.get('skill')
         }
+        # Fuzzy-matching candidate pools, built once instead of on every crop.
+        # `_skill_set` mirrors `skill_list` for O(1) membership; keep them in
+        # sync through `_add_skill`.
+        self._skill_set = set(self.skill_list)
+        self._hero_skill_candidates = frozenset(self.skill_hero_map)
+        self._all_skill_candidates = self._skill_set | self._hero_skill_candidates
+        self._skill_matchers: Dict[str, SequenceMatcher] = {}  # filled by _skill_similarity
+        # (text, threshold, is_hero_skill) -> fuzzy_match_skill result; reset by _add_skill
+        self._fuzzy_match_cache: Dict[Tuple[str, float, bool], Tuple[str, float]] = {}
 
         # Default season for newly extracted battles: the latest season present
         # anywhere in the database (heroes or skills). New screenshots almost
@@ -82,10 +111,14 @@ class SkillExtractionSystem:
         
         # Load OCR corrections for lookup
         self._ocr_error_patterns = {}  # Maps OCR text → correct text
-        self._ocr_image_hash_lookup = {}  # Maps image hash → correct text
+        self._ocr_image_hash_lookup = {}  # Maps raw crop bytes → correct text (exact pixel match)
         if self.use_ocr_corrections:
             self._load_ocr_corrections()
         
+        # Skill crop offsets, flattened from `skills_grid` on first use
+        self._skill_slots = None
+        self._crop_writer: Optional[ThreadPoolExecutor] = None
+        
         # Initialize PaddleOCR at startup (not lazy loading)
         self._initialize_ocr()
     
@@ -151,8 +184,7 @@ class SkillExtractionSystem:
                         try:
                             img = cv2.imread(image_path)
                             if img is not None:
-                                img_hash = hashlib.md5(img.tobytes()).hexdigest()
-                                self._ocr_image_hash_lookup[img_hash] = correct_text
+                                self._ocr_image_hash_lookup[img.tobytes()] = correct_text
                         except Exception:
                             pass
                     
@@ -164,7 +196,7 @@ class SkillExtractionSystem:
             normalized_patterns = {}
             for ocr_text, corrections in self._ocr_error_patterns.items():
                 # Get the most common correction
-                most_common = max(corrections.items(), key=lambda x: x[1])
+                most_common = max(corrections.items(), key=itemgetter(1))
                 normalized_patterns[ocr_text] = most_common[0]
             self._ocr_error_patterns = normalized_patterns
             
@@ -195,6 +227,15 @@ class SkillExtractionSystem:
         if 'text_rec_score_thresh' in ocr_settings:
             ocr_params['text_rec_score_thresh'] = ocr_settings['text_rec_score_thresh']
         
+        # Inference-engine settings (CPU MKLDNN/oneDNN, thread count, device) are
+        # shared by the primary model and every lazily built fallback model
+        self._ocr_engine_params = {
+            key: ocr_settings[key]
+            for key in ('device', 'enable_mkldnn', 'cpu_threads')
+            if key in ocr_settings
+        }
+        ocr_params.update(self._ocr_engine_params)
+        
         # Initialize the primary PaddleOCR instance at startup.
         self.ocr = PaddleOCR(**ocr_params)
         # The four fallback models are only needed for the minority of crops that
@@ -205,32 +246,50 @@ class SkillExtractionSystem:
         self._aggressive_ocr_2 = None
         self._enhanced_ocr = None
 
+    @property
+    def skill_slots(self) -> List[Tuple[int, int, int, int, int]]:
+        """(team, hero_idx, skill_idx, y, x) for every skill crop, in extraction order (computed once)."""
+        if self._skill_slots is None:
+            skills_grid = self.config['skills_grid']
+            team_y = ((1, skills_grid['top_team']['skills_y_positions']),
+                      (2, skills_grid['bottom_team']['skills_y_positions']))
+            self._skill_slots = [
+                (team_num, hero_idx, skill_idx, y, x)
+                for team_num, y_positions in team_y
+                for hero_idx, x in enumerate(skills_grid['heroes_x_positions'])
+                for skill_idx, y in enumerate(y_positions)
+            ]
+        return self._skill_slots
+
     @property
     def fallback_ocr(self):
         """No-size-limit fallback OCR (lazily initialized)."""
         if self._fallback_ocr is None:
-            self._fallback_ocr = PaddleOCR(lang='ch')
+            self._fallback_ocr = PaddleOCR(lang='ch', **self._ocr_engine_params)
         return self._fallback_ocr
 
     @property
     def aggressive_ocr_1(self):
         """Aggressive-threshold OCR for gamma-corrected crops (lazily initialized)."""
         if self._aggressive_ocr_1 is None:
-            self._aggressive_ocr_1 = PaddleOCR(lang='ch', text_det_thresh=0.1, text_det_box_thresh=0.2)
+            self._aggressive_ocr_1 = PaddleOCR(lang='ch', text_det_thresh=0.1, text_det_box_thresh=0.2,
+                                               **self._ocr_engine_params)
         return self._aggressive_ocr_1
 
     @property
     def aggressive_ocr_2(self):
         """Aggressive-threshold OCR for unsharp-masked crops (lazily initialized)."""
         if self._aggressive_ocr_2 is None:
-            self._aggressive_ocr_2 = PaddleOCR(lang='ch', text_det_unclip_ratio=3.0, text_det_thresh=0.1)
+            self._aggressive_ocr_2 = PaddleOCR(lang='ch', text_det_unclip_ratio=3.0, text_det_thresh=0.1,
+                                               **self._ocr_engine_params)
         return self._aggressive_ocr_2
 
     @property
     def enhanced_ocr(self):
         """Enhanced OCR for complex preprocessing (lazily initialized)."""
         if self._enhanced_ocr is None:
-            self._enhanced_ocr = PaddleOCR(lang='ch', text_det_thresh=0.05, text_det_box_thresh=0.1)
+            self._enhanced_ocr = PaddleOCR(lang='ch', text_det_thresh=0.05, text_det_box_thresh=0.1,
+                                            **self._ocr_engine_params)
         return self._enhanced_ocr
     
     def _apply_ocr_corrections(self, ocr_text: str) -> str:
@@ -248,29 +307,83 @@ class SkillExtractionSystem:
                 return self._ocr_error_patterns[ocr_text]
         return ocr_text
 
-    def _enhanced_ocr_predict(self, crop: np.ndarray) -> Tuple[str, float]:
+    def _corrected_crop_text(self, crop: np.ndarray) -> Optional[str]:
+        """Return the saved correction for an exact pixel match of this crop, if any"""
+        if self.use_ocr_corrections and self._ocr_image_hash_lookup:
+            try:
+                # Raw bytes as the key: the dict's own (non-cryptographic) hash
+                # is several times cheaper than an md5 digest and stays exact
+                return self._ocr_image_hash_lookup.get(crop.tobytes())
+            except Exception:
+                pass
+        return None
+
+    def _crop_is_blank(self, crop: np.ndarray) -> bool:
+        """True for a (non-empty) crop that is near-uniform, i.e. holds no text for OCR to find"""
+        if crop.size == 0 or crop.ndim != 3:
+            return False
+        return float(cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY).std()) < self.BLANK_CROP_STD
+
+    def _screen_crop(self, crop: np.ndarray) -> Optional[Tuple[str, float]]:
+        """Answer for a crop that needs no OCR (its saved correction, or "" when blank), else None"""
+        # Check OCR corrections: First try exact image hash match
+        correct_text = self._corrected_crop_text(crop)
+        if correct_text is not None:
+            return correct_text, 1.0  # High confidence for exact match
+        
+        # Blank slot: skip the primary model and all seven fallbacks
+        if self._crop_is_blank(crop):
+            return "", 0.0
+        return None
+
+    def _primary_ocr_batch(self, crops: List[np.ndarray]) -> List[Tuple[Optional[Tuple[str, float]], Optional[List]]]:
+        """
+        Screen many crops and run the primary OCR over the rest in a single
+        batched predict() call.
+        
+        Returns one ``(screened, primary_result)`` pair per crop. ``screened``
+        is the ``_screen_crop`` answer (saved correction or blank), and those
+        crops are not sent to the model. ``primary_result`` is shaped like
+        ``self.ocr.predict(crop)`` so it can be passed to
+        ``_enhanced_ocr_predict``; it is None for screened crops and for every
+        crop if the batch does not come back one result per crop.
+        """
+        screened = [self._screen_crop(crop) for crop in crops]
+        results: List[Optional[List]] = [None] * len(crops)
+        pending = [i for i, answer in enumerate(screened) if answer is None]
+        if pending:
+            try:
+                batch = list(self.ocr.predict([crops[i] for i in pending]))
+            except Exception:
+                batch = []
+            if len(batch) == len(pending):
+                for i, result in zip(pending, batch):
+                    results[i] = [result]
+        return list(zip(screened, results))
+
+    def _enhanced_ocr_predict(self, crop: np.ndarray, primary_result: Optional[List] = None,
+                              screened: bool = False) -> Tuple[str, float]:
         """
         Enhanced OCR prediction with fallback strategies for challenging images.
         Uses saved OCR corrections to improve accuracy.
         
         Args:
             crop: Image crop to perform OCR on
+            primary_result: Primary-OCR result for this crop from
+                ``_primary_ocr_batch``; computed here when None
+            screened: True when the caller already ran ``_screen_crop`` on this
+                crop and it needed OCR (the batched path), so it is not repeated
             
         Returns:
             tuple: (extracted_text, confidence_score)
         """
-        # Check OCR corrections: First try exact image hash match
-        if self.use_ocr_corrections and self._ocr_image_hash_lookup:
-            try:
-                crop_hash = hashlib.md5(crop.tobytes()).hexdigest()
-                if crop_hash in self._ocr_image_hash_lookup:
-                    correct_text = self._ocr_image_hash_lookup[crop_hash]
-                    return correct_text, 1.0  # High confidence for exact match
-            except Exception:
-                pass
+        if not screened:
+            answer = self._screen_crop(crop)
+            if answer is not None:
+                return answer
         
         # Try primary OCR first
-        result = self.ocr.predict(crop)
+        result = primary_result if primary_result is not None else self.ocr.predict(crop)
         
         if result and len(result) > 0 and 'rec_texts' in result[0] and result[0]['rec_texts']:
             texts = result[0]['rec_texts']
@@ -304,10 +417,15 @@ class SkillExtractionSystem:
         except Exception:
             pass
         
-        # Fallback 3: Gamma correction preprocessing
+        # Grayscale crop shared by the gamma, unsharp and bilateral fallbacks below
         try:
             gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
-            gamma_corrected = np.array(255 * (gray / 255) ** 0.5, dtype='uint8')
+        except Exception:
+            gray = None
+        
+        # Fallback 3: Gamma correction preprocessing
+        try:
+            gamma_corrected = cv2.LUT(gray, _GAMMA_LUT_05)
             gamma_crop = cv2.cvtColor(gamma_corrected, cv2.COLOR_GRAY2BGR)
             
             # Try with aggressive OCR settings (pre-initialized)
@@ -355,7 +473,6 @@ class SkillExtractionSystem:
         
         # Fallback 6: Unsharp masking with aggressive OCR
         try:
-            gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
             blurred = cv2.GaussianBlur(gray, (0, 0), 1.0)
             unsharp = cv2.addWeighted(gray, 1.5, blurred, -0.5, 0)
             unsharp_crop = cv2.cvtColor(unsharp, cv2.COLOR_GRAY2BGR)
@@ -374,9 +491,8 @@ class SkillExtractionSystem:
         
         # Fallback 7: Complex preprocessing (bilateral + gamma + scale)
         try:
-            gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
             bilateral = cv2.bilateralFilter(gray, 9, 75, 75)
-            gamma_corrected = np.array(255 * (bilateral / 255) ** 0.4, dtype='uint8')
+            gamma_corrected = cv2.LUT(bilateral, _GAMMA_LUT_04)
             height, width = gamma_corrected.shape
             scaled = cv2.resize(cv2.cvtColor(gamma_corrected, cv2.COLOR_GRAY2BGR), 
                               (width * 3, height * 3), interpolation=cv2.INTER_CUBIC)
@@ -406,11 +522,10 @@ class SkillExtractionSystem:
         base = os.path.splitext(os.path.basename(image_path))[0]
         return os.path.join(self._crops_root_dir(), base)
 
-    def _save_crop(self, crop: np.ndarray, image_path: str, team: int, hero: int, skill: int) -> Optional[str]:
+    def _save_crop(self, crop: np.ndarray, out_dir: str, team: int, hero: int, skill: int) -> Optional[str]:
+        """Write one audit crop into `out_dir` (created by the caller, once per image)"""
         if not self.save_cropped_images:
             return None
-        out_dir = self._crops_dir_for_image(image_path)
-        os.makedirs(out_dir, exist_ok=True)
         fname = f"t{team}_h{hero}_s{skill}.png"
         out_path = os.path.join(out_dir, fname)
         try:
@@ -419,6 +534,21 @@ class SkillExtractionSystem:
         except Exception:
             return None
 
+    def _crop_writer_pool(self) -> ThreadPoolExecutor:
+        """Single background thread for audit-crop writes (created on first use)"""
+        if self._crop_writer is None:
+            self._crop_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='crop-writer')
+        return self._crop_writer
+
+    def close(self):
+        """Finish any pending audit-crop writes and stop the writer thread.
+
+        Safe to call more than once; a later extraction starts a new writer.
+        """
+        if self._crop_writer is not None:
+            self._crop_writer.shutdown(wait=True)
+            self._crop_writer = None
+
     def _render_ascii_preview(self, crop: np.ndarray, max_width: int = 48) -> str:
         """Render a small ASCII-art preview for terminal display."""
         if crop is None or crop.size == 0:
@@ -432,13 +562,9 @@ class SkillExtractionSystem:
             target_w = max(8, min(max_width, w))
             target_h = max(1, int(h * (target_w / w) * 0.55))
             resized = cv2.resize(gray, (target_w, target_h), interpolation=cv2.INTER_AREA)
-            chars = " .:-=+*#%@"
-            scale = (len(chars) - 1) / 255.0
-            lines = []
-            for r in resized:
-                line = ''.join(chars[int(px * scale)] for px in r)
-                lines.append(line)
-            return "\n".join(lines)
+            # One vectorised lookup maps every pixel to its character byte
+            rows = _ASCII_LUT[resized]
+            return "\n".join(row.tobytes().decode('ascii') for row in rows)
         except Exception:
             return "(preview failed)"
 
@@ -565,26 +691,42 @@ class SkillExtractionSystem:
                 print(f"⚠️  Failed to save fixture: {e}")
             return None
 
+    def _add_skill(self, skill_name: str) -> bool:
+        """Add a skill to the in-memory skill list; return False if already known"""
+        if skill_name in self._skill_set:
+            return False
+        self.skill_list.append(skill_name)
+        self._skill_set.add(skill_name)
+        self._all_skill_candidates.add(skill_name)
+        self._fuzzy_match_cache.clear()  # candidate pool changed
+        return True
+
+    def _skill_similarity(self, extracted_text: str, skill: str) -> float:
+        """SequenceMatcher ratio of OCR text vs a skill name"""
+        # Substring matches: the shorter string matches as one block, so the
+        # ratio is exactly 2*shorter/total (always >= the shorter/longer
+        # substring bonus) and needs no matcher at all.
+        if extracted_text in skill or skill in extracted_text:
+            return 2.0 * min(len(extracted_text), len(skill)) / (len(extracted_text) + len(skill))
+
+        # One matcher per candidate skill, kept across calls: difflib indexes
+        # seq2 (the skill) once, so each query only swaps in seq1.
+        matcher = self._skill_matchers.get(skill)
+        if matcher is None:
+            matcher = self._skill_matchers[skill] = SequenceMatcher(None, "", skill)
+        matcher.set_seq1(extracted_text)
+        return matcher.ratio()
+
     def top_k_skill_matches(self, extracted_text: str, k: int = 5) -> List[Tuple[str, float]]:
         """Return top-k skill candidates by fuzzy similarity (Chinese query only)"""
         candidates: List[Tuple[str, float]] = []
         if not extracted_text:
             return candidates
-        # Combine skill_list and skill_hero_map keys to search all available skills
-        all_skills = set(self.skill_list)
-        if self.skill_hero_map:
-            all_skills.update(self.skill_hero_map.keys())
-        for skill in all_skills:
-            similarity = SequenceMatcher(None, extracted_text, skill).ratio()
-            if extracted_text in skill:
-                substring_bonus = len(extracted_text) / len(skill)
-                similarity = max(similarity, substring_bonus)
-            if skill in extracted_text:
-                substring_bonus = len(skill) / len(extracted_text)
-                similarity = max(similarity, substring_bonus)
-            candidates.append((skill, similarity))
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates[:k]
+        # Search all available skills (skill_list plus skill_hero_map keys)
+        for skill in self._all_skill_candidates:
+            candidates.append((skill, self._skill_similarity(extracted_text, skill)))
+        # Bounded heap for the usual small k; same order as a full sort + slice.
+        return heapq.nlargest(k, candidates, key=itemgetter(1))
 
     def fuzzy_match_skill(self, extracted_text: str, threshold: Optional[float] = None, is_hero_skill: bool = False) -> Tuple[str, float]:
         """
@@ -606,38 +748,37 @@ class SkillExtractionSystem:
         if threshold is None:
             threshold = self.config.get("fuzzy_matching", {}).get("threshold", 0.5)
         
+        # The same OCR strings recur across screenshots; reuse earlier results
+        key = (extracted_text, threshold, is_hero_skill)
+        match = self._fuzzy_match_cache.get(key)
+        if match is None:
+            match = self._fuzzy_match_cache[key] = self._rank_skill_match(extracted_text, threshold, is_hero_skill)
+        return match
+
+    def _rank_skill_match(self, extracted_text: str, threshold: float, is_hero_skill: bool) -> Tuple[str, float]:
+        """Score every candidate skill and pick the best match (uncached body of fuzzy_match_skill)"""
         # For hero skills, only consider skills in skill_hero_map
         # For other skills, consider all skills from skill_list and skill_hero_map
         if is_hero_skill:
-            if not self.skill_hero_map:
+            if not self._hero_skill_candidates:
                 return "", 0.0
-            all_skills = set(self.skill_hero_map.keys())
+            all_skills = self._hero_skill_candidates
         else:
-            all_skills = set(self.skill_list)
-            if self.skill_hero_map:
-                all_skills.update(self.skill_hero_map.keys())
-        
+            all_skills = self._all_skill_candidates
+
+        # Clean OCR of a known name: it scores 1.0, and no other (short) name
+        # can come within the tie-breaking margin, so skip the scan
+        if extracted_text in all_skills:
+            return extracted_text, 1.0
+
         # Track all candidates with their scores
         candidates = []
         
         for skill in all_skills:
-            # Calculate similarity using SequenceMatcher
-            similarity = SequenceMatcher(None, extracted_text, skill).ratio()
-            
-            # Bonus for substring matches
-            if extracted_text in skill:
-                substring_bonus = len(extracted_text) / len(skill)
-                similarity = max(similarity, substring_bonus)
-            
-            # Bonus for reverse substring matches
-            if skill in extracted_text:
-                substring_bonus = len(skill) / len(extracted_text)
-                similarity = max(similarity, substring_bonus)
-            
-            candidates.append((skill, similarity))
+            candidates.append((skill, self._skill_similarity(extracted_text, skill)))
         
         # Sort by score (descending)
-        candidates.sort(key=lambda x: x[1], reverse=True)
+        candidates.sort(key=itemgetter(1), reverse=True)
         
         if not candidates:
             return "", 0.0
@@ -661,10 +802,10 @@ class SkillExtractionSystem:
                 top_candidates = [c for c in candidates if best_score - c[1] <= tie_breaking_threshold]
                 
                 # For non-hero skills: prefer skills in skill_list (not in skill_hero_map)
-                regular_skill_candidates = [c for c in top_candidates if c[0] in self.skill_list and c[0] not in self.skill_hero_map]
+                regular_skill_candidates = [c for c in top_candidates if c[0] in self._skill_set and c[0] not in self.skill_hero_map]
                 if regular_skill_candidates:
                     # Use the one with highest score among regular skills
-                    best_match, best_score = max(regular_skill_candidates, key=lambda x: x[1])
+                    best_match, best_score = max(regular_skill_candidates, key=itemgetter(1))
         
         # Return match if above threshold
         if best_score >= threshold:
@@ -794,233 +935,256 @@ class SkillExtractionSystem:
         height = skills_grid['skill_dimensions']['height']
         fuzzy_threshold = self.config.get('fuzzy_matching', {}).get('threshold', 0.5)
         
-        # Extract all skills first
-        all_skills = {}  # {team: {hero: [skills]}}
-        fuzzy_failures = []
-        user_interference_occurred = False  # Track if user manually intervened
-        
-        for team_num in [1, 2]:
-            all_skills[team_num] = {}
-            y_positions = top_y if team_num == 1 else bottom_y
-            team_name = "top" if team_num == 1 else "bottom"
+        # Crop every skill slot up front so the primary OCR runs as one batched
+        # predict() call; the fallback ladder still runs per low-confidence crop.
+        # Contiguous copies make the correction-lookup tobytes() a plain memcpy.
+        crops = {
+            (team_num, hero_idx, skill_idx): np.ascontiguousarray(image[y:y+height, x:x+width])
+            for team_num, hero_idx, skill_idx, y, x in self.skill_slots
+        }
+        # Audit crops are PNG-encoded on a background thread, submitted before
+        # the batched primary OCR so the writes overlap it
+        crop_writes = []
+        if self.save_cropped_images:
+            crops_dir = self._crops_dir_for_image(image_path)
+            os.makedirs(crops_dir, exist_ok=True)
+            crop_writes = [
+                self._crop_writer_pool().submit(
+                    self._save_crop, crop, crops_dir, team_num, hero_idx + 1, skill_idx + 1
+                )
+                for (team_num, hero_idx, skill_idx), crop in crops.items()
+            ]
+        try:
+            primary_results = dict(zip(crops, self._primary_ocr_batch(list(crops.values()))))
             
-            if verbose:
-                print(f"Extracting {team_name} team skills...")
+            # Extract all skills first
+            all_skills = {}  # {team: {hero: [skills]}}
+            fuzzy_failures = []
+            user_interference_occurred = False  # Track if user manually intervened
             
-            for hero_idx, x in enumerate(heroes_x):
-                hero_skills = []
-                for skill_idx, y in enumerate(y_positions):
-                    # Crop skill area
-                    crop = image[y:y+height, x:x+width]
+            for team_num in [1, 2]:
+                all_skills[team_num] = {}
+                y_positions = top_y if team_num == 1 else bottom_y
+                team_name = "top" if team_num == 1 else "bottom"
+                
+                if verbose:
+                    print(f"Extracting {team_name} team skills...")
+                
+                for hero_idx, x in enumerate(heroes_x):
+                    hero_skills = []
+                    for skill_idx, y in enumerate(y_positions):
+                        # Crop skill area
+                        crop = crops[(team_num, hero_idx, skill_idx)]
 
-                    # Save crop if enabled
-                    self._save_crop(crop, image_path, team_num, hero_idx + 1, skill_idx + 1)
+                        # Perform enhanced OCR with fallbacks, unless the batch already
+                        # answered this crop from a saved correction or as blank
+                        screened, primary_result = primary_results[(team_num, hero_idx, skill_idx)]
+                        if screened is not None:
+                            raw_text, ocr_confidence = screened
+                        else:
+                            raw_text, ocr_confidence = self._enhanced_ocr_predict(
+                                crop, primary_result=primary_result, screened=True
+                            )
+                        raw_text = (raw_text or "").strip()
+                        
+                        # Discard battle if OCR returns empty text (indicates coordinate mismatch or image issue)
+                        if not raw_text:
+                            raise ValueError(
+                                f"OCR returned empty text for Team {team_num}, Hero {hero_idx + 1}, Skill {skill_idx + 1} - "
+                                f"battle discarded. This may indicate coordinate mismatch with image dimensions. "
+                                f"Image: {image_path}"
+                            )
+                        
+                        # Discard battle if OCR returns "进攻" (indicates incorrect image or coordinate mismatch)
+                        if raw_text == "进攻":
+                            raise ValueError(
+                                f"OCR returned '进攻' for Team {team_num}, Hero {hero_idx + 1}, Skill {skill_idx + 1} - "
+                                f"battle discarded. This may indicate incorrect image or coordinate mismatch. "
+                                f"Image: {image_path}"
+                            )
 
-                    # Perform enhanced OCR with fallbacks
-                    raw_text, ocr_confidence = self._enhanced_ocr_predict(crop)
-                    raw_text = (raw_text or "").strip()
-                    
-                    # Discard battle if OCR returns empty text (indicates coordinate mismatch or image issue)
-                    if not raw_text:
-                        raise ValueError(
-                            f"OCR returned empty text for Team {team_num}, Hero {hero_idx + 1}, Skill {skill_idx + 1} - "
-                            f"battle discarded. This may indicate coordinate mismatch with image dimensions. "
-                            f"Image: {image_path}"
-                        )
-                    
-                    # Discard battle if OCR returns "进攻" (indicates incorrect image or coordinate mismatch)
-                    if raw_text == "进攻":
-                        raise ValueError(
-                            f"OCR returned '进攻' for Team {team_num}, Hero {hero_idx + 1}, Skill {skill_idx + 1} - "
-                            f"battle discarded. This may indicate incorrect image or coordinate mismatch. "
-                            f"Image: {image_path}"
-                        )
+                        # Discard battle if OCR returns "普攻" (basic attack) - indicates the hero
+                        # had no real skill detected for that slot, so the whole battle is unusable.
+                        if raw_text == "普攻":
+                            raise ValueError(
+                                f"OCR returned '普攻' for Team {team_num}, Hero {hero_idx + 1}, Skill {skill_idx + 1} - "
+                                f"battle discarded (普攻 detected). "
+                                f"Image: {image_path}"
+                            )
+                        
+                        # Apply fuzzy matching
+                        # First skill (skill_idx == 0) is always the hero skill
+                        is_hero_skill = (skill_idx == 0)
+                        matched_skill, confidence = self.fuzzy_match_skill(raw_text, is_hero_skill=is_hero_skill)
 
-                    # Discard battle if OCR returns "普攻" (basic attack) - indicates the hero
-                    # had no real skill detected for that slot, so the whole battle is unusable.
-                    if raw_text == "普攻":
-                        raise ValueError(
-                            f"OCR returned '普攻' for Team {team_num}, Hero {hero_idx + 1}, Skill {skill_idx + 1} - "
-                            f"battle discarded (普攻 detected). "
-                            f"Image: {image_path}"
-                        )
-                    
-                    # Apply fuzzy matching
-                    # First skill (skill_idx == 0) is always the hero skill
-                    is_hero_skill = (skill_idx == 0)
-                    matched_skill, confidence = self.fuzzy_match_skill(raw_text, is_hero_skill=is_hero_skill)
-
-                    
-                    # Interactive resolution for low-confidence or unknown match
-                    if interactive and ((not matched_skill) or (matched_skill == raw_text and confidence < fuzzy_threshold)):
-                        # Save a temp crop to help user verify visually; optionally print ASCII preview
-                        tmp_path = self._save_tmp_crop(crop, image_path, team_num, hero_idx + 1, skill_idx + 1)
-                        if self.show_ascii_preview:
-                            self._print_crop_preview(crop, label=f"Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}", saved_path=tmp_path)
-                        else:
-                            print(f"\n  [Crop Saved] Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1} → {tmp_path or '(failed to save)'}")
+                        
+                        # Interactive resolution for low-confidence or unknown match
+                        if interactive and ((not matched_skill) or (matched_skill == raw_text and confidence < fuzzy_threshold)):
+                            # Save a temp crop to help user verify visually; optionally print ASCII preview
+                            tmp_path = self._save_tmp_crop(crop, image_path, team_num, hero_idx + 1, skill_idx + 1)
+                            if self.show_ascii_preview:
+                                self._print_crop_preview(crop, label=f"Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}", saved_path=tmp_path)
+                            else:
+                                print(f"\n  [Crop Saved] Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1} → {tmp_path or '(failed to save)'}")
 
-                        # Build full candidate list (ranked) and paginate
-                        candidates_full = self.top_k_skill_matches(raw_text, k=len(self.skill_list))
-                        # Ensure preferred/common skills are surfaced at the top of the chooser
-                        try:
-                            preferred = [s for s in self.PREFERRED_SKILLS if s in self.skill_list]
-                        except Exception:
-                            preferred = []
-                        if preferred:
-                            existing = set(sk for sk, _ in candidates_full)
-                            # Move existing preferred to front, and add any missing preferred with a high score
-                            reordered = []
-                            for s in preferred:
-                                if s in existing:
-                                    # Remove existing occurrence
-                                    candidates_full = [(sk, sc) for (sk, sc) in candidates_full if sk != s]
-                                    reordered.append((s, 1.0))
-                                else:
-                                    reordered.append((s, 1.0))
-                            candidates_full = reordered + candidates_full
-                        page_size = 10
-                        page = 0
-                        selected = None
-                        # Callback (if provided) gets the top-k from current page first
-                        if user_select_skill is not None:
+                            # Build full candidate list (ranked) and paginate
+                            candidates_full = self.top_k_skill_matches(raw_text, k=len(self.skill_list))
+                            # Ensure preferred/common skills are surfaced at the top of the chooser
                             try:
-                                selected = user_select_skill(
-                                    image_path, team_num, hero_idx + 1, raw_text,
-                                    candidates_full[:page_size]
-                                )
-                            except Exception as e:
-                                selected = None
-                                if verbose:
-                                    print(f"⚠️  Skill select callback failed: {e}")
-                        while selected is None:
-                            start = page * page_size
-                            end = min(start + page_size, len(candidates_full))
-                            page_candidates = candidates_full[start:end]
-                            # CLI prompt fallback with quick picks and custom/search entry
-                            print("\nManual selection required: unrecognized/low-confidence skill")
-                            print(f"  Image: {image_path}")
-                            print(f"  Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}")
-                            print(f"  OCR: '{raw_text}'  (best guess '{matched_skill}', {confidence:.3f})")
-                            # Quick picks: commonly missed by OCR
-                            quick_picks = [s for s in self.PREFERRED_SKILLS if s]
-                            if quick_picks:
-                                print("  Quick picks:")
-                                for i, s in enumerate(quick_picks, 1):
-                                    print(f"    {i}. {s}")
-                            print("  Commands:")
-                            print("   -1. Enter a custom skill name")
-                            choice = input("  Choose [number], or -1: ").strip()
-                            if choice == "-1":
-                                # Re-emit the saved path for convenience before custom input
-                                tmp_path2 = self._save_tmp_crop(crop, image_path, team_num, hero_idx + 1, skill_idx + 1)
-                                if self.show_ascii_preview:
-                                    self._print_crop_preview(crop, label=f"Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}", saved_path=tmp_path2)
-                                else:
-                                    print(f"  Crop path: {tmp_path2 or '(failed to save)'}")
-                                custom = input("  Enter custom skill: ").strip()
-                                if custom:
-                                    selected = custom
-                                    # If custom not in list, add it
-                                    if selected not in self.skill_list:
-                                        self.skill_list.append(selected)
-                                        if verbose:
-                                            print(f"  Added custom skill '{selected}' to database skill list")
-                                else:
-                                    print("  Empty input, try again.")
-                                continue
-                            else:
-                                # Numeric quick-pick selection
+                                preferred = [s for s in self.PREFERRED_SKILLS if s in self._skill_set]
+                            except Exception:
+                                preferred = []
+                            if preferred:
+                                # Preferred skills go first with a high score; drop their ranked
+                                # occurrences in the same single pass over the candidates
+                                preferred_set = set(preferred)
+                                candidates_full = [(s, 1.0) for s in preferred] + [
+                                    (sk, sc) for (sk, sc) in candidates_full if sk not in preferred_set
+                                ]
+                            page_size = 10
+                            page = 0
+                            selected = None
+                            # Callback (if provided) gets the top-k from current page first
+                            if user_select_skill is not None:
                                 try:
-                                    ci = int(choice)
-                                    if 1 <= ci <= len(quick_picks):
-                                        selected = quick_picks[ci - 1]
-                                        # If selected not in skill list, add it
-                                        if selected not in self.skill_list:
-                                            self.skill_list.append(selected)
+                                    selected = user_select_skill(
+                                        image_path, team_num, hero_idx + 1, raw_text,
+                                        candidates_full[:page_size]
+                                    )
+                                except Exception as e:
+                                    selected = None
+                                    if verbose:
+                                        print(f"⚠️  Skill select callback failed: {e}")
+                            while selected is None:
+                                start = page * page_size
+                                end = min(start + page_size, len(candidates_full))
+                                page_candidates = candidates_full[start:end]
+                                # CLI prompt fallback with quick picks and custom/search entry
+                                print("\nManual selection required: unrecognized/low-confidence skill")
+                                print(f"  Image: {image_path}")
+                                print(f"  Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}")
+                                print(f"  OCR: '{raw_text}'  (best guess '{matched_skill}', {confidence:.3f})")
+                                # Quick picks: commonly missed by OCR
+                                quick_picks = [s for s in self.PREFERRED_SKILLS if s]
+                                if quick_picks:
+                                    print("  Quick picks:")
+                                    for i, s in enumerate(quick_picks, 1):
+                                        print(f"    {i}. {s}")
+                                print("  Commands:")
+                                print("   -1. Enter a custom skill name")
+                                choice = input("  Choose [number], or -1: ").strip()
+                                if choice == "-1":
+                                    # Re-emit the saved path for convenience before custom input
+                                    # (only re-write the crop if the first save failed)
+                                    tmp_path2 = tmp_path or self._save_tmp_crop(crop, image_path, team_num, hero_idx + 1, skill_idx + 1)
+                                    if self.show_ascii_preview:
+                                        self._print_crop_preview(crop, label=f"Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}", saved_path=tmp_path2)
                                     else:
-                                        print("  Invalid choice, try again.")
-                                        continue
-                                except Exception:
-                                    print("  Invalid input, try again.")
+                                        print(f"  Crop path: {tmp_path2 or '(failed to save)'}")
+                                    custom = input("  Enter custom skill: ").strip()
+                                    if custom:
+                                        selected = custom
+                                        # If custom not in list, add it
+                                        if self._add_skill(selected):
+                                            if verbose:
+                                                print(f"  Added custom skill '{selected}' to database skill list")
+                                    else:
+                                        print("  Empty input, try again.")
                                     continue
-                        if selected:
-                            matched_skill = selected
-                            confidence = 1.0  # assume manual choice is correct
-                            user_interference_occurred = True  # Mark that user intervention occurred
-                            # Save OCR correction data for future improvement
-                            if raw_text != matched_skill:  # Only save if OCR was wrong
-                                correction_path = self._save_ocr_correction(
-                                    crop, raw_text, matched_skill, 
-                                    image_path, team_num, hero_idx + 1, skill_idx + 1
-                                )
-                                if correction_path and verbose:
-                                    print(f"  💾 Saved OCR correction: '{raw_text}' → '{matched_skill}'")
+                                else:
+                                    # Numeric quick-pick selection
+                                    try:
+                                        ci = int(choice)
+                                        if 1 <= ci <= len(quick_picks):
+                                            selected = quick_picks[ci - 1]
+                                            # If selected not in skill list, add it
+                                            self._add_skill(selected)
+                                        else:
+                                            print("  Invalid choice, try again.")
+                                            continue
+                                    except Exception:
+                                        print("  Invalid input, try again.")
+                                        continue
+                            if selected:
+                                matched_skill = selected
+                                confidence = 1.0  # assume manual choice is correct
+                                user_interference_occurred = True  # Mark that user intervention occurred
+                                # Save OCR correction data for future improvement
+                                if raw_text != matched_skill:  # Only save if OCR was wrong
+                                    correction_path = self._save_ocr_correction(
+                                        crop, raw_text, matched_skill, 
+                                        image_path, team_num, hero_idx + 1, skill_idx + 1
+                                    )
+                                    if correction_path and verbose:
+                                        print(f"  💾 Saved OCR correction: '{raw_text}' → '{matched_skill}'")
+                        
+                        hero_skills.append(matched_skill)
+                        
+                        # Record fuzzy failures (no confident mapping)
+                        if (not matched_skill) or (matched_skill == raw_text and confidence < fuzzy_threshold):
+                            fuzzy_failures.append({
+                                'team': team_num,
+                                'hero': hero_idx + 1,
+                                'skill': skill_idx + 1,
+                                'raw_text': raw_text,
+                                'confidence': float(confidence)
+                            })
+                        
+                        if verbose:
+                            status = "✓" if confidence >= 0.8 else "~" if confidence >= 0.5 else "?"
+                            print(f"  Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}: '{raw_text}' → '{matched_skill}' {status} ({confidence:.3f})")
+                    
+                    all_skills[team_num][hero_idx + 1] = hero_skills
+            
+            # Map heroes using first skills
+            result = {"1": [], "2": []}
+            
+            if verbose:
+                print("\nMapping heroes using first skills...")
+            
+            for team_key in ["1", "2"]:
+                team_num = int(team_key)
+                for hero_num in sorted(all_skills[team_num].keys()):
+                    skills = all_skills[team_num][hero_num]
+                    first_skill = skills[0] if skills else ""
+                    hero_name = self.map_skill_to_hero(first_skill)
                     
-                    hero_skills.append(matched_skill)
+                    # If hero is unknown, error out - this indicates a data integrity issue
+                    if isinstance(hero_name, str) and hero_name.startswith("Unknown("):
+                        raise ValueError(
+                            f"Unknown hero mapping for skill '{first_skill}' (Team {team_num}, Hero {hero_num}). "
+                            f"This indicates the skill is not in the database mapping. "
+                            f"Image: {image_path}"
+                        )
                     
-                    # Record fuzzy failures (no confident mapping)
-                    if (not matched_skill) or (matched_skill == raw_text and confidence < fuzzy_threshold):
-                        fuzzy_failures.append({
-                            'team': team_num,
-                            'hero': hero_idx + 1,
-                            'skill': skill_idx + 1,
-                            'raw_text': raw_text,
-                            'confidence': float(confidence)
-                        })
+                    result[team_key].append({
+                        "name": hero_name,
+                        "skills": skills
+                    })
                     
                     if verbose:
-                        status = "✓" if confidence >= 0.8 else "~" if confidence >= 0.5 else "?"
-                        print(f"  Team {team_num}, Hero {hero_idx+1}, Skill {skill_idx+1}: '{raw_text}' → '{matched_skill}' {status} ({confidence:.3f})")
-                
-                all_skills[team_num][hero_idx + 1] = hero_skills
-        
-        # Map heroes using first skills
-        result = {"1": [], "2": []}
-        
-        if verbose:
-            print("\nMapping heroes using first skills...")
-        
-        for team_key in ["1", "2"]:
-            team_num = int(team_key)
-            for hero_num in sorted(all_skills[team_num].keys()):
-                skills = all_skills[team_num][hero_num]
-                first_skill = skills[0] if skills else ""
-                hero_name = self.map_skill_to_hero(first_skill)
-                
-                # If hero is unknown, error out - this indicates a data integrity issue
-                if isinstance(hero_name, str) and hero_name.startswith("Unknown("):
-                    raise ValueError(
-                        f"Unknown hero mapping for skill '{first_skill}' (Team {team_num}, Hero {hero_num}). "
-                        f"This indicates the skill is not in the database mapping. "
-                        f"Image: {image_path}"
-                    )
-                
-                result[team_key].append({
-                    "name": hero_name,
-                    "skills": skills
-                })
-                
-                if verbose:
-                    print(f"  Team {team_num}, Hero {hero_num}: '{first_skill}' → '{hero_name}'")
-        
-        # Winner was already detected at the start - add it to result
-        result["winner"] = winner
+                        print(f"  Team {team_num}, Hero {hero_num}: '{first_skill}' → '{hero_name}'")
+            
+            # Winner was already detected at the start - add it to result
+            result["winner"] = winner
 
-        # Default the battle's season to the latest season in the database.
-        # New screenshots are (almost) always from the current season, so this
-        # keeps battle reports season-labelled without manual entry.
-        if self.default_season is not None:
-            result["season"] = self.default_season
+            # Default the battle's season to the latest season in the database.
+            # New screenshots are (almost) always from the current season, so this
+            # keeps battle reports season-labelled without manual entry.
+            if self.default_season is not None:
+                result["season"] = self.default_season
 
-        # Attach diagnostics
-        result['fuzzy_match_failures'] = fuzzy_failures
-        
-        # Save fixture if user interference occurred
-        if user_interference_occurred:
-            self._save_fixture(image_path, image, result, verbose)
-        
-        return result
+            # Attach diagnostics
+            result['fuzzy_match_failures'] = fuzzy_failures
+            
+            # Save fixture if user interference occurred
+            if user_interference_occurred:
+                self._save_fixture(image_path, image, result, verbose)
+            
+            return result
+        finally:
+            # Never return with audit-crop writes in flight, also when the battle is discarded
+            wait(crop_writes)
     
     def save_results(self, results: Dict, output_path: str):
         """Save extraction results to JSON file"""
@@ -0,0 +1,127 @@
+"""OCR-free tests for the batch driver's per-image outcomes and summary tally.
+
+The extractor is replaced by a stub that decides each image's fate from its
+file name. Spawned worker processes could not see that stub, so the parallel
+path runs its pool inline here. That still covers the buffered logs, the
+ordering of outcomes and the final tally."""
+
+import importlib
+import importlib.util
+import os
+import sys
+import types
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("cv2")
+
+# The part after the underscore tells the stub extractor what to do with the image
+IMAGE_NAMES = [
+    "a_ok.png",
+    "b_fuzzy.png",
+    "c_draw.jpg",
+    "d_basic.jpeg",
+    "e_error.png",
+    "f_ok.PNG",
+    "g_fuzzy.png",
+]
+
+
+class _StubExtractor:
+    def extract_skills_from_image(self, image_path, verbose=True, interactive=False):
+        kind = os.path.splitext(os.path.basename(image_path))[0].split("_", 1)[1]
+        if kind == "draw":
+            raise ValueError("Battle is a draw (平) - battle discarded")
+        if kind == "basic":
+            raise ValueError("OCR returned '普攻' - battle discarded")
+        if kind == "error":
+            raise RuntimeError("unreadable image")
+        hero = {"name": "刘禅", "skills": ["释权御下", "刚烈", "闭月"]}
+        results = {"1": [hero] * 3, "2": [hero] * 3, "winner": "1"}
+        if kind == "fuzzy":
+            results["fuzzy_match_failures"] = [
+                {"team": 1, "hero": 1, "skill": 2, "raw_text": "刚?", "confidence": 0.2}
+            ]
+        return results
+
+    def save_results(self, results, output_path):
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("{}")
+
+    def close(self):
+        pass
+
+
+class _InlinePool:
+    """ProcessPoolExecutor stand-in that runs the initializer and map in-process."""
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None):
+        self.initializer = initializer
+
+    def __enter__(self):
+        if self.initializer is not None:
+            self.initializer()
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+
+@pytest.fixture(scope="module")
+def batch_module():
+    """Import the batch script the way it runs (image_extraction/ on sys.path)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(os.path.abspath("image_extraction"))
+        if importlib.util.find_spec("paddleocr") is None:
+            mp.setitem(sys.modules, "paddleocr", types.SimpleNamespace(PaddleOCR=None))
+        return importlib.import_module("batch_extract_battles")
+
+
+def _run_batch(batch_module, monkeypatch, tmp_path, workers, capsys):
+    image_dir = tmp_path / "data" / "images"
+    image_dir.mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    for name in IMAGE_NAMES:
+        (image_dir / name).write_bytes(b"")
+    monkeypatch.setattr(batch_module, "_get_extractor", _StubExtractor)
+    monkeypatch.setattr(batch_module, "ProcessPoolExecutor", _InlinePool)
+
+    report = batch_module.batch_extract_battles(interactive=False, workers=workers)
+    output = capsys.readouterr().out
+    statuses = Counter(r["status"] for r in report["summary"])
+    remaining = sorted(os.listdir(image_dir))
+    return report, statuses, remaining, output
+
+
+def test_serial_and_parallel_paths_tally_the_same(batch_module, monkeypatch, tmp_path, capsys):
+    serial = _run_batch(batch_module, monkeypatch, tmp_path / "serial", 1, capsys)
+    parallel = _run_batch(batch_module, monkeypatch, tmp_path / "parallel", 3, capsys)
+
+    serial_report, serial_statuses, serial_remaining, serial_output = serial
+    parallel_report, parallel_statuses, parallel_remaining, parallel_output = parallel
+
+    assert serial_statuses == Counter({
+        "success": 2,
+        "skipped: 1 fuzzy match failures": 2,
+        "draw (discarded)": 1,
+        "普攻 (discarded)": 1,
+        "error: unreadable image": 1,
+    })
+    assert parallel_statuses == serial_statuses
+    assert parallel_report == serial_report
+
+    # Only images flagged for removal (fuzzy-match issues) stay on disk
+    assert serial_remaining == ["b_fuzzy.png", "g_fuzzy.png"]
+    assert parallel_remaining == serial_remaining
+    for output in (serial_output, parallel_output):
+        assert "Keeping 2 images with issues" in output
+        assert "[7/7] Processing: data/images/g_fuzzy.png" in output
+
+    # The parent only builds an extractor on the serial path
+    assert "Initializing Skill Extraction System..." in serial_output
+    assert "Starting 3 extraction workers..." in parallel_output
+    assert "Initializing Skill Extraction System..." not in parallel_output
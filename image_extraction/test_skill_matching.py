@@ -0,0 +1,179 @@
+"""OCR-free unit tests for the extractor's crop screening and skill matching.
+
+PaddleOCR is replaced by a stand-in that must never be called, so these run
+wherever cv2 is installed, even when the OCR models are not."""
+
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import types
+from difflib import SequenceMatcher
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+MODULE_NAME = "image_extraction.skill_extraction_system"
+CONFIG_PATH = os.path.join("image_extraction", "extraction_config.json")
+DATABASE_PATH = os.path.join("web", "public", "game-data", "database.json")
+LABELLED_SCREENSHOT = os.path.join("image_extraction", "fixtures", "20251222-105040-453258_f17a780d.png")
+
+
+class _UnusedOCR:
+    """PaddleOCR stand-in: accepts the constructor kwargs, fails if asked to OCR."""
+
+    def __init__(self, **params):
+        self.params = params
+
+    def predict(self, *args, **kwargs):
+        raise AssertionError("OCR must not run in these tests")
+
+
+@pytest.fixture(scope="module")
+def extraction_module():
+    """Import the extractor module, with a placeholder `paddleocr` if it is not installed."""
+    with pytest.MonkeyPatch.context() as mp:
+        if importlib.util.find_spec("paddleocr") is None:
+            mp.setitem(sys.modules, "paddleocr", types.SimpleNamespace(PaddleOCR=_UnusedOCR))
+        return importlib.import_module(MODULE_NAME)
+
+
+@pytest.fixture
+def extractor(extraction_module, tmp_path, monkeypatch):
+    """A real SkillExtractionSystem over the real database, writing nothing outside tmp_path."""
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    config["output_format"].update(
+        save_cropped_images=False,
+        save_ocr_corrections=False,
+        use_ocr_corrections=False,
+        output_directory=str(tmp_path / "extracted_results"),
+        tmp_crops_directory=str(tmp_path / "tmp_crops"),
+    )
+    config_path = tmp_path / "extraction_config.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    monkeypatch.setattr(extraction_module, "PaddleOCR", _UnusedOCR)
+    return extraction_module.SkillExtractionSystem(config_path=str(config_path), database_path=DATABASE_PATH)
+
+
+# --------------------------------------------------------------------------- #
+# Blank-crop screening
+# --------------------------------------------------------------------------- #
+def test_uniform_crop_is_blank(extractor):
+    crop = np.full((42, 138, 3), 87, dtype=np.uint8)
+    assert extractor._crop_is_blank(crop)
+
+
+def test_near_uniform_crop_is_blank(extractor):
+    rng = np.random.default_rng(0)
+    crop = np.clip(87 + rng.integers(-3, 4, size=(42, 138, 3)), 0, 255).astype(np.uint8)
+    gray_std = float(cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY).std())
+    assert 0 < gray_std < extractor.BLANK_CROP_STD
+    assert extractor._crop_is_blank(crop)
+
+
+def test_real_skill_crops_are_not_blank(extractor):
+    """Every skill slot of a labelled screenshot holds text and must reach OCR."""
+    image = cv2.imread(LABELLED_SCREENSHOT)
+    assert image is not None, f"missing fixture {LABELLED_SCREENSHOT}"
+    dims = extractor.config["skills_grid"]["skill_dimensions"]
+    for team, hero_idx, skill_idx, y, x in extractor.skill_slots:
+        crop = image[y:y + dims["height"], x:x + dims["width"]]
+        assert not extractor._crop_is_blank(crop), (team, hero_idx + 1, skill_idx + 1)
+
+
+# --------------------------------------------------------------------------- #
+# Fuzzy-match cache
+# --------------------------------------------------------------------------- #
+def test_added_skill_replaces_cached_miss(extractor):
+    """A custom skill added mid-run must not be shadowed by an earlier cached miss."""
+    new_skill = "天外飞仙"
+    threshold = 0.5
+    assert new_skill not in extractor._all_skill_candidates
+
+    # A miss echoes the OCR text back with a below-threshold score (and is cached)
+    missed, miss_score = extractor.fuzzy_match_skill(new_skill, threshold)
+    assert missed == new_skill
+    assert miss_score < threshold
+
+    assert extractor._add_skill(new_skill)
+    assert extractor.fuzzy_match_skill(new_skill, threshold) == (new_skill, 1.0)
+
+
+# --------------------------------------------------------------------------- #
+# Similarity scores against a fresh difflib reference
+# --------------------------------------------------------------------------- #
+# Exact regular / hero / shared names, a fragment, a superstring, a one-character
+# misread, and strings with no real match.
+MATCH_QUERIES = ["战八方", "刚烈", "万人之敌", "八方", "战八方之", "惩前必后", "天外飞仙", "进攻"]
+
+
+def _reference_similarity(text, skill):
+    """The original per-call scoring: a fresh SequenceMatcher plus substring bonuses."""
+    similarity = SequenceMatcher(None, text, skill).ratio()
+    if text in skill:
+        similarity = max(similarity, len(text) / len(skill))
+    if skill in text:
+        similarity = max(similarity, len(skill) / len(text))
+    return similarity
+
+
+@pytest.mark.parametrize("text", MATCH_QUERIES)
+def test_skill_similarity_matches_fresh_sequence_matcher(extractor, text):
+    for skill in extractor._all_skill_candidates:
+        # Twice: the second call goes through the cached per-skill matcher
+        for _ in range(2):
+            assert extractor._skill_similarity(text, skill) == _reference_similarity(text, skill), skill
+
+
+def _reference_ranking(text, pool):
+    """Original ranking: score every candidate, then a full stable sort."""
+    candidates = [(skill, _reference_similarity(text, skill)) for skill in pool]
+    candidates.sort(key=lambda c: c[1], reverse=True)
+    return candidates
+
+
+def _reference_fuzzy_match(extractor, text, threshold, is_hero_skill):
+    """Original fuzzy_match_skill: full scan, tie-break towards regular skills."""
+    pool = extractor._hero_skill_candidates if is_hero_skill else extractor._all_skill_candidates
+    candidates = _reference_ranking(text, pool)
+    best_match, best_score = candidates[0]
+    if (len(candidates) > 1 and best_score - candidates[1][1] <= 0.02
+            and best_score >= threshold and not is_hero_skill):
+        regular = [
+            c for c in candidates
+            if best_score - c[1] <= 0.02
+            and c[0] in extractor.skill_list and c[0] not in extractor.skill_hero_map
+        ]
+        if regular:
+            best_match, best_score = max(regular, key=lambda c: c[1])
+    if best_score >= threshold:
+        return best_match, best_score
+    return text, best_score
+
+
+@pytest.mark.parametrize("text", MATCH_QUERIES)
+def test_top_k_skill_matches_matches_full_sort(extractor, text):
+    expected = _reference_ranking(text, extractor._all_skill_candidates)
+    for k in (1, 5, len(expected)):
+        assert extractor.top_k_skill_matches(text, k=k) == expected[:k]
+
+
+@pytest.mark.parametrize("is_hero_skill", [False, True])
+@pytest.mark.parametrize("text", MATCH_QUERIES)
+def test_fuzzy_match_skill_matches_full_scan(extractor, text, is_hero_skill):
+    threshold = extractor.config["fuzzy_matching"]["threshold"]
+    expected = _reference_fuzzy_match(extractor, text, threshold, is_hero_skill)
+    assert extractor.fuzzy_match_skill(text, is_hero_skill=is_hero_skill) == expected
+
+
+@pytest.mark.parametrize("skill", ["战八方", "刚烈", "万人之敌"])
+def test_exact_skill_name_outranks_every_other_candidate(extractor, skill):
+    """The exact-name short-circuit is only safe if no rival is within the 0.02 tie-break margin."""
+    scores = [s for name, s in extractor.top_k_skill_matches(skill, k=len(extractor._all_skill_candidates))
+              if name != skill]
+    assert max(scores) < 1.0 - 0.02
+    assert extractor.fuzzy_match_skill(skill) == (skill, 1.0)
@@ -147,6 +147,11 @@ def load_database(path: str) -> Dict[str, List[str]]:
     }
 
 
+# One SequenceMatcher per canonical name, kept as seq2 so its b2j index is
+# built once; each query only swaps in seq1 (ratio() is not symmetric).
+_CANDIDATE_MATCHERS: Dict[str, SequenceMatcher] = {}
+
+
 def best_match(token: str, candidates: List[str], threshold: float) -> Optional[str]:
     """Return the closest canonical candidate to *token*, or None.
 
@@ -161,7 +166,11 @@ def best_match(token: str, candidates: List[str], threshold: float) -> Optional[
 
     best, best_score = None, 0.0
     for cand in candidates:
-        score = SequenceMatcher(None, token, cand).ratio()
+        matcher = _CANDIDATE_MATCHERS.get(cand)
+        if matcher is None:
+            matcher = _CANDIDATE_MATCHERS[cand] = SequenceMatcher(None, "", cand)
+        matcher.set_seq1(token)
+        score = matcher.ratio()
         # Light length-similarity bonus to prefer same-length names.
         len_pen = 1.0 - abs(len(token) - len(cand)) / max(len(token), len(cand))
         score = 0.85 * score + 0.15 * len_pen
@@ -272,15 +281,16 @@ def dhash(crop_bgr: np.ndarray, hash_size: int = 16) -> int:
     """
     gray = cv2.cvtColor(crop_bgr, cv2.COLOR_BGR2GRAY)
     resized = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
-    diff = resized[:, 1:] > resized[:, :-1]
-    bits = 0
-    for b in diff.flatten():
-        bits = (bits << 1) | int(b)
-    return bits
+    diff = (resized[:, 1:] > resized[:, :-1]).ravel()
+    # Pack the comparison bits MSB-first into one int in a single C call
+    # (trailing pad bits from packbits are shifted back out).
+    packed = np.packbits(diff).tobytes()
+    return int.from_bytes(packed, "big") >> (-diff.size % 8)
 
 
 def hamming(a: int, b: int) -> int:
-    return bin(a ^ b).count("1")
+    # int.bit_count is a native popcount; no 256-char binary string per pair.
+    return (a ^ b).bit_count()
 
 
 # Two cropped panels with a dHash Hamming distance <= this are treated as the
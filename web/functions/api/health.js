@@ -1,7 +1,11 @@
+const HEALTH_BODY = JSON.stringify({
+  ok: true,
+  service: 'game-advisor-api',
+  runtime: 'cloudflare-pages-functions',
+});
+
 export async function onRequestGet() {
-  return Response.json({
-    ok: true,
-    service: 'game-advisor-api',
-    runtime: 'cloudflare-pages-functions',
+  return new Response(HEALTH_BODY, {
+    headers: { 'Content-Type': 'application/json' },
   });
 }